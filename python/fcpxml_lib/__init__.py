@@ -4,18 +4,50 @@ FCPXML Python Library
 A modular library for generating valid FCPXML documents following comprehensive validation rules.
 """
 
-from .core.fcpxml import create_empty_project, save_fcpxml, create_media_asset, add_media_to_timeline
-from .models.elements import Asset, Format, MediaRep, Resources, Spine, Sequence, Project, Event, Library, FCPXML
-from .validation.validators import validate_frame_alignment, validate_resource_id, validate_audio_rate
-from .utils.timing import convert_seconds_to_fcp_duration
-from .utils.ids import generate_uid, generate_resource_id
-from .exceptions import FCPXMLError, ValidationError
+import importlib
+
+# Public names are imported on first access (PEP 562), so importing one
+# submodule (e.g. fcpxml_lib.utils.timing) does not load the whole library.
+_EXPORTS = {
+    "create_empty_project": ".core.fcpxml",
+    "save_fcpxml": ".core.fcpxml",
+    "create_media_asset": ".core.fcpxml",
+    "add_media_to_timeline": ".core.fcpxml",
+    "Asset": ".models.elements",
+    "Format": ".models.elements",
+    "MediaRep": ".models.elements",
+    "Resources": ".models.elements",
+    "Spine": ".models.elements",
+    "Sequence": ".models.elements",
+    "Project": ".models.elements",
+    "Event": ".models.elements",
+    "Library": ".models.elements",
+    "FCPXML": ".models.elements",
+    "validate_frame_alignment": ".validation.validators",
+    "validate_resource_id": ".validation.validators",
+    "validate_audio_rate": ".validation.validators",
+    "validate_fcpxml_version": ".validation.validators",
+    "convert_seconds_to_fcp_duration": ".utils.timing",
+    "generate_uid": ".utils.ids",
+    "generate_resource_id": ".utils.ids",
+    "FCPXMLError": ".exceptions",
+    "ValidationError": ".exceptions",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "1.0.0"
 __all__ = [
     "FCPXML", "create_empty_project", "save_fcpxml", "create_media_asset", "add_media_to_timeline",
     "Asset", "Format", "MediaRep", "Resources", "Spine", "Sequence", "Project", "Event", "Library",
-    "validate_frame_alignment", "validate_resource_id", "validate_audio_rate",
+    "validate_frame_alignment", "validate_resource_id", "validate_audio_rate", "validate_fcpxml_version",
     "convert_seconds_to_fcp_duration", "generate_uid", "generate_resource_id",
     "FCPXMLError", "ValidationError"
-]
\ No newline at end of file
+]
@@ -26,24 +26,44 @@ Modules:
 - many_video_fx: Create tiled video animation effect
 """
 
-from .create_empty_project import create_empty_project_cmd
-from .create_random_video import create_random_video_cmd
-from .video_at_edge import video_at_edge_cmd
-from .stress_test import stress_test_cmd
-from .random_font import random_font_cmd
-from .animation import animation_cmd
-from .many_video_fx import many_video_fx_cmd
-from .squares_fx import squares_fx_cmd
-from .remove_sq import remove_sq_cmd
-
-__all__ = [
-    'create_empty_project_cmd',
-    'create_random_video_cmd', 
-    'video_at_edge_cmd',
-    'stress_test_cmd',
-    'random_font_cmd',
-    'animation_cmd',
-    'many_video_fx_cmd',
-    'squares_fx_cmd',
-    'remove_sq_cmd'
-]
\ No newline at end of file
+import importlib
+from pathlib import Path
+
+from fcpxml_lib.constants import (
+    HORIZONTAL_FORMAT_WIDTH, HORIZONTAL_FORMAT_HEIGHT,
+    VERTICAL_FORMAT_WIDTH, VERTICAL_FORMAT_HEIGHT
+)
+
+# Default output files land next to main.py; shared inputs (assets/, reference/)
+# live one level up at the repository root. Resolved once at import time.
+SCRIPT_DIR = Path(__file__).resolve().parent.parent.parent
+REPO_ROOT = SCRIPT_DIR.parent
+
+# Project formats as printed by the commands that take --horizontal.
+HORIZONTAL_FORMAT_DESC = f"{HORIZONTAL_FORMAT_WIDTH}x{HORIZONTAL_FORMAT_HEIGHT} horizontal"
+VERTICAL_FORMAT_DESC = f"{VERTICAL_FORMAT_WIDTH}x{VERTICAL_FORMAT_HEIGHT} vertical"
+
+# Command handlers are imported on first access (PEP 562) so that running one
+# command does not import every other command module and its dependencies.
+_COMMAND_MODULES = {
+    'create_empty_project_cmd': '.create_empty_project',
+    'create_random_video_cmd': '.create_random_video',
+    'video_at_edge_cmd': '.video_at_edge',
+    'stress_test_cmd': '.stress_test',
+    'random_font_cmd': '.random_font',
+    'animation_cmd': '.animation',
+    'many_video_fx_cmd': '.many_video_fx',
+    'squares_fx_cmd': '.squares_fx',
+    'remove_sq_cmd': '.remove_sq',
+}
+
+
+def __getattr__(name):
+    if name in _COMMAND_MODULES:
+        handler = getattr(importlib.import_module(_COMMAND_MODULES[name], __name__), name)
+        globals()[name] = handler
+        return handler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_COMMAND_MODULES)
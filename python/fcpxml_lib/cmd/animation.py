@@ -29,12 +29,12 @@ def animation_cmd(args):
     
     input_dir = Path(args.input_files[0])
     
-    if not input_dir.exists():
-        print(f"❌ Directory not found: {input_dir}", file=sys.stderr)
-        sys.exit(1)
-    
+    # One stat on the normal path; only look closer to word the error
     if not input_dir.is_dir():
-        print(f"❌ Path is not a directory: {input_dir}", file=sys.stderr)
+        if input_dir.exists():
+            print(f"❌ Path is not a directory: {input_dir}", file=sys.stderr)
+        else:
+            print(f"❌ Directory not found: {input_dir}", file=sys.stderr)
         sys.exit(1)
     
     # Find MOV files in directory
@@ -9,6 +9,7 @@ Following comprehensive crash prevention rules and NO_XML_TEMPLATES principle.
 import sys
 from pathlib import Path
 
+from fcpxml_lib.cmd import SCRIPT_DIR, HORIZONTAL_FORMAT_DESC, VERTICAL_FORMAT_DESC
 from fcpxml_lib import (
     create_empty_project, save_fcpxml, ValidationError,
     Sequence
@@ -36,11 +37,12 @@ def create_empty_project_cmd(args):
     print("Following crash prevention rules for safe FCPXML generation")
     print()
     
-    # Test validation system first
-    test_validation_failure()
+    # Test validation system first (opt-in)
+    if args.self_check:
+        test_validation_failure()
     
     # Create empty project with format choice
-    format_desc = "1280x720 horizontal" if args.horizontal else "1080x1920 vertical"
+    format_desc = HORIZONTAL_FORMAT_DESC if args.horizontal else VERTICAL_FORMAT_DESC
     print(f"   Format: {format_desc}")
     
     fcpxml = create_empty_project(
@@ -58,7 +60,7 @@ def create_empty_project_cmd(args):
     print()
     
     # Save to file with validation
-    output_path = Path(args.output) if args.output else Path(__file__).parent.parent.parent / "empty_project.fcpxml"
+    output_path = Path(args.output) if args.output else SCRIPT_DIR / "empty_project.fcpxml"
     validation_passed = save_fcpxml(fcpxml, str(output_path))
     
     if validation_passed:
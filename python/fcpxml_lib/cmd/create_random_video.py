@@ -10,6 +10,7 @@ import sys
 import random
 from pathlib import Path
 
+from fcpxml_lib.cmd import SCRIPT_DIR, HORIZONTAL_FORMAT_DESC, VERTICAL_FORMAT_DESC
 from fcpxml_lib import (
     create_empty_project, save_fcpxml, add_media_to_timeline
 )
@@ -19,7 +20,7 @@ from fcpxml_lib.utils.media import discover_all_media_files
 def create_random_video_cmd(args):
     """Create a random video from media files in a directory"""
     input_dir = Path(args.input_dir)
-    if not input_dir.exists() or not input_dir.is_dir():
+    if not input_dir.is_dir():  # also False when the path does not exist
         print(f"❌ Directory not found: {input_dir}")
         sys.exit(1)
     
@@ -35,7 +36,7 @@ def create_random_video_cmd(args):
     # Randomly shuffle the files
     random.shuffle(media_files)
     
-    format_desc = "1280x720 horizontal" if args.horizontal else "1080x1920 vertical"
+    format_desc = HORIZONTAL_FORMAT_DESC if args.horizontal else VERTICAL_FORMAT_DESC
     print(f"🎬 Creating random video from {len(media_files)} media files...")
     print(f"   Input directory: {input_dir}")
     print(f"   Format: {format_desc}")
@@ -70,7 +71,7 @@ def create_random_video_cmd(args):
         print("   Creating empty project instead")
     
     # Save to file with validation
-    output_path = Path(args.output) if args.output else Path(__file__).parent.parent.parent / "random_video.fcpxml"
+    output_path = Path(args.output) if args.output else SCRIPT_DIR / "random_video.fcpxml"
     validation_passed = save_fcpxml(fcpxml, str(output_path))
     
     if validation_passed:
@@ -101,12 +101,12 @@ def many_video_fx_cmd(args):
     # Get input directory from args
     input_dir = Path(args.input_dir)
     
-    if not input_dir.exists():
-        print(f"❌ Directory not found: {input_dir}", file=sys.stderr)
-        sys.exit(1)
-    
+    # One stat on the normal path; only look closer to word the error
     if not input_dir.is_dir():
-        print(f"❌ Path is not a directory: {input_dir}", file=sys.stderr)
+        if input_dir.exists():
+            print(f"❌ Path is not a directory: {input_dir}", file=sys.stderr)
+        else:
+            print(f"❌ Directory not found: {input_dir}", file=sys.stderr)
         sys.exit(1)
     
     # Find MOV files in directory
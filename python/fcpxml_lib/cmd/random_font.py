@@ -11,10 +11,13 @@ import random
 import colorsys
 from pathlib import Path
 
+from fcpxml_lib.cmd import REPO_ROOT
 from fcpxml_lib import create_empty_project, save_fcpxml
+from fcpxml_lib.core.fcpxml import create_media_asset
 from fcpxml_lib.models.elements import Title
 from fcpxml_lib.utils.timing import convert_seconds_to_fcp_duration
 from fcpxml_lib.utils.ids import generate_resource_id, set_resource_id_counter
+from fcpxml_lib.utils.media import discover_all_media_files
 
 
 def get_contrasting_colors():
@@ -178,7 +181,7 @@ def random_font_cmd(args):
     """Create a 9-minute video with random font titles"""
     
     # Load fonts from reference file
-    fonts_file = Path(__file__).parent.parent.parent.parent / "reference" / "fonts.txt"
+    fonts_file = REPO_ROOT / "reference" / "fonts.txt"
     fonts = load_fonts_from_file(fonts_file)
     
     if not fonts:
@@ -220,8 +223,7 @@ def random_font_cmd(args):
     sequence = fcpxml.library.events[0].projects[0].sequences[0]
     
     # Pick a random background asset from ../assets/
-    assets_dir = Path(__file__).parent.parent.parent.parent / "assets"
-    from fcpxml_lib.utils.media import discover_all_media_files
+    assets_dir = REPO_ROOT / "assets"
     
     # Find all media files in assets directory
     image_files, video_files = discover_all_media_files(assets_dir)
@@ -236,7 +238,6 @@ def random_font_cmd(args):
     print(f"   Using background: {background_file.name}")
     
     # Create background asset and add to resources
-    from fcpxml_lib.core.fcpxml import create_media_asset
     background_asset_id = generate_resource_id()
     background_format_id = generate_resource_id()
     
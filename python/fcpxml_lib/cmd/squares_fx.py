@@ -21,8 +21,10 @@ def squares_fx_cmd(args):
     output_file = args.output if hasattr(args, 'output') and args.output else "squares_fx.fcpxml"
     duration_seconds = 10.0
     
-    # Validate tiles directory
-    if not tiles_dir.exists():
+    # Validate tiles directory and list it once, instead of probing each tile path
+    try:
+        tile_names = set(os.listdir(tiles_dir))
+    except OSError:
         print(f"Error: Tiles directory not found: {tiles_dir}")
         return False
     
@@ -31,9 +33,8 @@ def squares_fx_cmd(args):
     for col in range(4):  # col0, col1, col2, col3
         for row in range(7):  # row0-row6
             filename = f"col{col}_row{row}.png"
-            filepath = tiles_dir / filename
-            if filepath.exists():
-                png_files.append(filepath)
+            if filename in tile_names:
+                png_files.append(tiles_dir / filename)
             else:
                 print(f"Warning: Missing tile: {filename}")
     
@@ -9,6 +9,7 @@ Following comprehensive crash prevention rules and NO_XML_TEMPLATES principle.
 import sys
 from pathlib import Path
 
+from fcpxml_lib.cmd import SCRIPT_DIR, REPO_ROOT
 from fcpxml_lib import (
     create_empty_project, save_fcpxml
 )
@@ -26,8 +27,8 @@ def stress_test_cmd(args):
     print()
     
     # Get all available assets
-    assets_dir = Path(__file__).parent.parent.parent.parent / "assets"
-    if not assets_dir.exists():
+    assets_dir = REPO_ROOT / "assets"
+    if not assets_dir.is_dir():  # one stat; also rejects a plain file
         print(f"❌ Assets directory not found: {assets_dir}")
         sys.exit(1)
     
@@ -57,7 +58,7 @@ def stress_test_cmd(args):
         raise
     
     # Save with validation
-    output_path = Path(args.output) if args.output else Path(__file__).parent.parent.parent / "stress_test.fcpxml"
+    output_path = Path(args.output) if args.output else SCRIPT_DIR / "stress_test.fcpxml"
     validation_passed = save_fcpxml(fcpxml, str(output_path))
     
     if validation_passed:
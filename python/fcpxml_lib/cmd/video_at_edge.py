@@ -9,6 +9,7 @@ Following comprehensive crash prevention rules and NO_XML_TEMPLATES principle.
 import sys
 from pathlib import Path
 
+from fcpxml_lib.cmd import SCRIPT_DIR
 from fcpxml_lib import (
     create_empty_project, save_fcpxml
 )
@@ -19,7 +20,7 @@ from fcpxml_lib.utils.media import discover_image_files
 def video_at_edge_cmd(args):
     """Create video with random images (PNG/JPG) tiled across visible area on multiple lanes"""
     input_dir = Path(args.input_dir)
-    if not input_dir.exists() or not input_dir.is_dir():
+    if not input_dir.is_dir():  # also False when the path does not exist
         print(f"❌ Directory not found: {input_dir}")
         sys.exit(1)
     
@@ -64,7 +65,7 @@ def video_at_edge_cmd(args):
         print("   Creating empty project instead")
     
     # Save to file with validation
-    output_path = Path(args.output) if args.output else Path(__file__).parent.parent.parent / "video_at_edge.fcpxml"
+    output_path = Path(args.output) if args.output else SCRIPT_DIR / "video_at_edge.fcpxml"
     validation_passed = save_fcpxml(fcpxml, str(output_path))
     
     if validation_passed:
@@ -68,6 +68,9 @@ DEFAULT_VIDEO_DURATION = 10.0  # seconds
 # Resource ID pattern validation
 RESOURCE_ID_PATTERN = r"^r\d+$"  # r1, r2, r3, etc.
 
+# FCPXML version pattern (major.minor)
+FCPXML_VERSION_PATTERN = r"^\d+\.\d+$"  # e.g., "1.13", "1.11", etc.
+
 # Valid audio rates (FCP enumerated values)
 VALID_AUDIO_RATES = ["32k", "44.1k", "48k", "88.2k", "96k", "176.4k", "192k"]
 
@@ -104,9 +107,11 @@ REQUIRED_SMART_COLLECTIONS = [
 ]
 
 # File extension mappings
-IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg"}
-VIDEO_EXTENSIONS = {".mp4", ".mov"}
-AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".aac", ".flac", ".caf"}
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg"})
+VIDEO_EXTENSIONS = frozenset({".mp4", ".mov"})
+DISCOVERY_VIDEO_EXTENSIONS = frozenset({".mov", ".mp4", ".avi", ".mkv", ".m4v"})  # Picked up when scanning media folders
+AUDIO_EXTENSIONS = frozenset({".wav", ".mp3", ".m4a", ".aac", ".flac", ".caf"})
+STILL_IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".tiff", ".bmp", ".gif"})  # Placed as timeless Video elements
 
 # 🚨 CRITICAL CRASH PREVENTION RULES:
 """
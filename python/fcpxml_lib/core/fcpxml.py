@@ -2,6 +2,7 @@
 Core FCPXML document handling.
 """
 
+import subprocess
 import sys
 from pathlib import Path
 
@@ -11,13 +12,13 @@ from ..constants import (
     VIDEO_COLOR_SPACE, REQUIRED_SMART_COLLECTIONS, IMAGE_DURATION,
     IMAGE_FORMAT_NAME, IMAGE_COLOR_SPACE, DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT,
     DEFAULT_VIDEO_WIDTH, DEFAULT_VIDEO_HEIGHT, DEFAULT_VIDEO_DURATION, IMAGE_START_TIME,
-    STANDARD_FRAME_RATE, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS,
+    STANDARD_FRAME_RATE, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, STILL_IMAGE_EXTENSIONS,
     VERTICAL_FORMAT_WIDTH, VERTICAL_FORMAT_HEIGHT, HORIZONTAL_FORMAT_WIDTH, HORIZONTAL_FORMAT_HEIGHT,
     VERTICAL_SCALE_FACTOR, ASPECT_RATIO_PORTRAIT_THRESHOLD
 )
 from ..utils.ids import generate_uid
 from ..utils.timing import convert_seconds_to_fcp_duration
-from ..serialization.xml_serializer import serialize_to_xml
+from ..serialization.xml_serializer import build_xml_tree, write_xml_tree
 from ..validation.xml_validator import run_xml_validation
 
 
@@ -114,8 +115,6 @@ def detect_video_properties(file_path: str) -> dict:
     - Return safe defaults if detection fails
     - NEVER assume audio exists (causes crashes)
     """
-    import subprocess
-    
     try:
         # Get video properties using ffprobe
         cmd = [
@@ -177,8 +176,6 @@ def detect_image_properties(file_path: str) -> dict:
     
     Returns aspect ratio and dimensions for images to determine if scaling is needed.
     """
-    import subprocess
-    
     try:
         # Get image properties using ffprobe
         cmd = [
@@ -229,8 +226,9 @@ def create_media_asset(file_path: str, asset_id: str, format_id: str, clip_durat
     uid = generate_uid(f"MEDIA_{abs_path.name}")
     
     # Detect media type
-    is_image = abs_path.suffix.lower() in IMAGE_EXTENSIONS
-    is_video = abs_path.suffix.lower() in VIDEO_EXTENSIONS
+    suffix = abs_path.suffix.lower()
+    is_image = suffix in IMAGE_EXTENSIONS
+    is_video = suffix in VIDEO_EXTENSIONS
     
     if not (is_image or is_video):
         raise ValueError(f"Unsupported media type: {abs_path.suffix}")
@@ -361,8 +359,13 @@ def add_media_to_timeline(fcpxml: FCPXML, media_files: list[str], clip_duration_
     timeline_position = 0.0
     resource_counter = len(fcpxml.resources.assets) + len(fcpxml.resources.formats) + 1
     
-    # Collect all timeline elements to sort by start time
-    all_timeline_elements = []
+    # 🚨 CRITICAL: Spine elements must be ordered by start time (required by FCP).
+    # Each clip starts where the previous one ended, so appending in file order
+    # is already sorted and elements go straight into the spine in one pass.
+    sequence.spine.ordered_elements = []
+    
+    # Every clip has the same duration
+    clip_duration = convert_seconds_to_fcp_duration(clip_duration_seconds)
     
     for media_file in media_files:
         try:
@@ -375,8 +378,8 @@ def add_media_to_timeline(fcpxml: FCPXML, media_files: list[str], clip_duration_
             asset, format_obj = create_media_asset(media_file, asset_id, format_id, clip_duration_seconds)
             
             # 🚨 CRITICAL VALIDATION: Prevent AssetClip crash patterns
-            image_extensions = {'.jpg', '.jpeg', '.png', '.tiff', '.bmp', '.gif'}
-            is_image = Path(media_file).suffix.lower() in image_extensions
+            media_path = Path(media_file)
+            is_image = media_path.suffix.lower() in STILL_IMAGE_EXTENSIONS
             
             # Validate against crash patterns from CLAUDE.md
             if is_image and asset.duration != "0s":
@@ -393,7 +396,6 @@ def add_media_to_timeline(fcpxml: FCPXML, media_files: list[str], clip_duration_
             
             if is_image:
                 # Images: Use Video element with offset and start attributes
-                clip_duration = convert_seconds_to_fcp_duration(clip_duration_seconds)
                 # 🚨 CRITICAL: Use frame boundary value from working samples
                 # All working samples use "3600s" for Video elements
                 start_time = IMAGE_START_TIME  # Standard frame boundary used by FCP
@@ -404,78 +406,38 @@ def add_media_to_timeline(fcpxml: FCPXML, media_files: list[str], clip_duration_
                     "duration": clip_duration,
                     "offset": convert_seconds_to_fcp_duration(timeline_position),
                     "start": start_time,  # Use specific timing pattern from samples
-                    "name": Path(media_file).stem,
-                    "start_time": timeline_position  # For sorting
+                    "name": media_path.stem
                 }
                 
                 # Add scaling for vertical format only if aspect ratio requires it
                 if not use_horizontal and needs_vertical_scaling(media_file, is_image=True):
                     element["adjust_transform"] = {"scale": VERTICAL_SCALE_FACTOR}
+                
+                sequence.spine.videos.append(element)
             else:
                 # Videos: Use AssetClip element with NO start attribute
-                clip_duration = convert_seconds_to_fcp_duration(clip_duration_seconds)
                 element = {
                     "type": "asset-clip", 
                     "ref": asset_id,
                     "duration": clip_duration,  # Use clip duration
                     "offset": convert_seconds_to_fcp_duration(timeline_position),
                     # 🚨 REMOVED: AssetClips don't need start attribute per samples/simple_video1.fcpxml
-                    "name": Path(media_file).stem,
-                    "start_time": timeline_position  # For sorting
+                    "name": media_path.stem
                 }
                 
                 # Add scaling for vertical format only if aspect ratio requires it
                 if not use_horizontal and needs_vertical_scaling(media_file, is_image=False):
                     element["adjust_transform"] = {"scale": VERTICAL_SCALE_FACTOR}
+                
+                sequence.spine.asset_clips.append(element)
             
-            all_timeline_elements.append(element)
+            sequence.spine.ordered_elements.append(element)
             timeline_position += clip_duration_seconds
             
         except Exception as e:
             print(f"⚠️  Skipping {media_file}: {e}")
             continue
     
-    # 🚨 CRITICAL: Sort elements by start time (required by FCP)
-    all_timeline_elements.sort(key=lambda x: x["start_time"])
-    
-    # Store elements in a single list for proper spine ordering
-    sequence.spine.ordered_elements = []
-    
-    # Add sorted elements to spine (preserving order for serializer)
-    for element in all_timeline_elements:
-        if element["type"] == "video":
-            video_clip = {
-                "type": "video",
-                "ref": element["ref"],
-                "duration": element["duration"],
-                "offset": element["offset"],
-                "start": element["start"],  # Include start attribute for Video elements
-                "name": element["name"]
-            }
-            
-            # Add transform if present
-            if "adjust_transform" in element:
-                video_clip["adjust_transform"] = element["adjust_transform"]
-            
-            sequence.spine.videos.append(video_clip)
-            sequence.spine.ordered_elements.append(video_clip)
-        else:  # asset-clip
-            asset_clip = {
-                "type": "asset-clip",
-                "ref": element["ref"],
-                "duration": element["duration"],
-                "offset": element["offset"],
-                # NO start attribute for AssetClip elements
-                "name": element["name"]
-            }
-            
-            # Add transform if present
-            if "adjust_transform" in element:
-                asset_clip["adjust_transform"] = element["adjust_transform"]
-            
-            sequence.spine.asset_clips.append(asset_clip)
-            sequence.spine.ordered_elements.append(asset_clip)
-    
     # Update sequence duration
     total_duration = convert_seconds_to_fcp_duration(timeline_position)
     sequence.duration = total_duration
@@ -488,14 +450,15 @@ def save_fcpxml(fcpxml: FCPXML, output_path: str) -> bool:
     Returns True if successful and well-formed, False otherwise.
     🚨 CRITICAL: XML validation is mandatory for crash prevention
     """
-    xml_content = serialize_to_xml(fcpxml)
-    
-    # Add XML declaration (no DTD for now as it requires Apple's server)
-    fcpxml_with_header = f'''<?xml version="1.0" encoding="UTF-8"?>
-{xml_content}'''
+    # Build the tree before opening the file so a serialization error
+    # cannot leave a truncated document behind.
+    root = build_xml_tree(fcpxml)
     
+    # Add XML declaration (no DTD for now as it requires Apple's server), then
+    # stream the document into the file instead of building it as one string.
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(fcpxml_with_header)
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        write_xml_tree(root, f)
     
     print(f"📄 FCPXML saved to: {output_path}")
     
@@ -14,7 +14,8 @@ from fcpxml_lib.utils.timing import convert_seconds_to_fcp_duration
 from fcpxml_lib.utils.ids import generate_uid
 from fcpxml_lib.constants import (
     IMAGE_FORMAT_NAME, DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT, IMAGE_COLOR_SPACE,
-    IMAGE_DURATION, VERTICAL_SCALE_FACTOR
+    IMAGE_DURATION, IMAGE_START_TIME, VERTICAL_SCALE_FACTOR,
+    IMAGE_EXTENSIONS, DISCOVERY_VIDEO_EXTENSIONS
 )
 
 
@@ -33,6 +34,9 @@ def create_edge_tiled_timeline(fcpxml, image_files, background_video, duration,
     
     resource_counter = len(fcpxml.resources.assets) + len(fcpxml.resources.formats) + 1
     
+    # Background, tiles and sequence all span the full timeline duration
+    timeline_duration = convert_seconds_to_fcp_duration(duration)
+    
     # Create shared format definitions to avoid redundancy
     image_format_id = f"r{resource_counter}"
     resource_counter += 1
@@ -63,11 +67,11 @@ def create_edge_tiled_timeline(fcpxml, image_files, background_video, duration,
             fcpxml.resources.formats.append(format_obj)
             
             # Determine if background video needs scaling
-            is_video = bg_path.suffix.lower() in {'.mov', '.mp4', '.avi', '.mkv', '.m4v'}
+            is_video = bg_path.suffix.lower() in DISCOVERY_VIDEO_EXTENSIONS
             needs_scaling = needs_vertical_scaling(str(bg_path), is_image=not is_video)
             
             # Create background element (use appropriate type based on media)
-            bg_duration = convert_seconds_to_fcp_duration(duration)
+            bg_duration = timeline_duration
             
             if is_video:
                 # Background is a video - use asset-clip
@@ -110,130 +114,31 @@ def create_edge_tiled_timeline(fcpxml, image_files, background_video, duration,
         if "nested_elements" not in bg_element:
             bg_element["nested_elements"] = []
         
-        current_lane = 1
-        total_tiles = num_lanes * tiles_per_lane
+        # Use proper timing like Info.fcpxml (start="3600s" pattern)
+        assets, tile_elements = _create_image_tiles(
+            image_files, num_lanes * tiles_per_lane, resource_counter, image_format_id, timeline_duration,
+            tile_start=IMAGE_START_TIME  # PNG start time like Info.fcpxml
+        )
+        resource_counter += len(assets)
+        fcpxml.resources.assets.extend(assets)
         
-        for tile_index in range(total_tiles):
-            # Select random image file
-            image_file = random.choice(image_files)
-            
-            # Create asset using shared image format
-            asset_id = f"r{resource_counter}"
-            resource_counter += 1
-            
-            # Create asset manually to use shared format
-            abs_path = Path(image_file).resolve()
-            uid = generate_uid(f"MEDIA_{abs_path.name}")
-            media_rep = MediaRep(src=str(abs_path))
-            
-            asset = Asset(
-                id=asset_id,
-                name=abs_path.stem,
-                uid=uid,
-                duration=IMAGE_DURATION,
-                has_video="1",
-                format=image_format_id,  # Use shared format
-                video_sources="1",
-                media_rep=media_rep
-            )
-            fcpxml.resources.assets.append(asset)
-            
-            # Generate random position within visible screen area (much tighter bounds)
-            x_pos = random.uniform(-30.0, 30.0)  # Narrower X range for better visibility
-            y_pos = random.uniform(-50.0, 50.0)  # Narrower Y range for better visibility
-            
-            # Generate random scale (smaller tiles)
-            scale = random.uniform(0.1, 0.5)  # 10% to 50% original size
-            
-            # Create PNG tile element as nested video inside background (like Go's addSlidingPngImageToAssetClip)
-            tile_duration = convert_seconds_to_fcp_duration(duration)
-            
-            # Use proper timing like Info.fcpxml (start="3600s" pattern)
-            tile_offset = "0s"  # When PNG appears relative to background start
-            tile_start = "3600s"   # PNG start time like Info.fcpxml
-            
-            tile_element = {
-                "type": "video",
-                "ref": asset_id,
-                "lane": current_lane,  # Each PNG gets its own lane (like Go implementation)
-                "duration": tile_duration,
-                "offset": tile_offset,
-                "start": tile_start,  # Match Info.fcpxml timing
-                "name": f"{image_file.stem}_lane_{current_lane}",
-                "adjust_transform": {
-                    "position": f"{x_pos:.3f} {y_pos:.3f}",
-                    "scale": f"{scale:.3f} {scale:.3f}"
-                }
-            }
-            
-            # Add as nested element inside background (Pattern A - like Go/Info.fcpxml)
-            bg_element["nested_elements"].append(tile_element)
-            
-            # Increment lane for next PNG
-            current_lane += 1
+        # Add as nested elements inside background (Pattern A - like Go/Info.fcpxml)
+        bg_element["nested_elements"].extend(tile_elements)
     else:
         # If no background video, fall back to separate spine elements
-        current_lane = 1
-        total_tiles = num_lanes * tiles_per_lane
+        assets, tile_elements = _create_image_tiles(
+            image_files, num_lanes * tiles_per_lane, resource_counter, image_format_id, timeline_duration,
+            tile_start="0s"  # Required for image video elements
+        )
+        resource_counter += len(assets)
+        fcpxml.resources.assets.extend(assets)
         
-        for tile_index in range(total_tiles):
-            # Select random image file
-            image_file = random.choice(image_files)
-            
-            # Create asset using shared image format
-            asset_id = f"r{resource_counter}"
-            resource_counter += 1
-            
-            # Create asset manually to use shared format
-            abs_path = Path(image_file).resolve()
-            uid = generate_uid(f"MEDIA_{abs_path.name}")
-            media_rep = MediaRep(src=str(abs_path))
-            
-            asset = Asset(
-                id=asset_id,
-                name=abs_path.stem,
-                uid=uid,
-                duration=IMAGE_DURATION,
-                has_video="1",
-                format=image_format_id,  # Use shared format
-                video_sources="1",
-                media_rep=media_rep
-            )
-            fcpxml.resources.assets.append(asset)
-            
-            # Generate random position within visible screen area (much tighter bounds)
-            x_pos = random.uniform(-30.0, 30.0)  # Narrower X range for better visibility
-            y_pos = random.uniform(-50.0, 50.0)  # Narrower Y range for better visibility
-            
-            # Generate random scale (smaller tiles)
-            scale = random.uniform(0.1, 0.5)  # 10% to 50% original size
-            
-            # Create PNG tile element as separate spine element with lane
-            tile_duration = convert_seconds_to_fcp_duration(duration)
-            
-            tile_element = {
-                "type": "video",
-                "ref": asset_id,
-                "lane": current_lane,  # Each PNG gets its own lane
-                "duration": tile_duration,
-                "offset": "0s",
-                "start": "0s",  # Required for image video elements
-                "name": f"{image_file.stem}_lane_{current_lane}",
-                "adjust_transform": {
-                    "position": f"{x_pos:.3f} {y_pos:.3f}",
-                    "scale": f"{scale:.3f} {scale:.3f}"
-                }
-            }
-            
-            # Add as separate spine element with lane number
-            sequence.spine.videos.append(tile_element)
-            sequence.spine.ordered_elements.append(tile_element)
-            
-            # Increment lane for next PNG
-            current_lane += 1
+        # Add as separate spine elements, each with its own lane number
+        sequence.spine.videos.extend(tile_elements)
+        sequence.spine.ordered_elements.extend(tile_elements)
     
     # Update sequence duration
-    sequence.duration = convert_seconds_to_fcp_duration(duration)
+    sequence.duration = timeline_duration
     
     total_tiles = num_lanes * tiles_per_lane
     print(f"   Generated {total_tiles} random image tiles, each on its own lane (lanes 1-{total_tiles})")
@@ -246,6 +151,87 @@ def create_edge_tiled_timeline(fcpxml, image_files, background_video, duration,
     print(f"   Original request: {num_lanes} lanes × {tiles_per_lane} tiles = {total_tiles} total image lanes")
 
 
+def _create_image_tiles(image_files, total_tiles, resource_counter, image_format_id, tile_duration, tile_start):
+    """
+    Build one image asset and one lane video element per tile for create_edge_tiled_timeline.
+    
+    All random draws are made up front for the whole batch, and the tiles are then
+    built in a single loop over those values. Each tile gets its own lane (1..total_tiles)
+    and its own asset referencing the shared image format. tile_duration is an FCP
+    duration string shared by every tile.
+    
+    Returns (assets, tile_elements).
+    """
+    tile_images = random.choices(image_files, k=total_tiles)
+    
+    # lo + (hi - lo) * random() is exactly what random.uniform computes, minus a
+    # Python-level call per sample
+    rand = random.random
+    
+    # Random position within visible screen area (much tighter bounds)
+    x_positions = [-30.0 + 60.0 * rand() for _ in range(total_tiles)]  # Narrower X range (-30 to 30) for better visibility
+    y_positions = [-50.0 + 100.0 * rand() for _ in range(total_tiles)]  # Narrower Y range (-50 to 50) for better visibility
+    
+    # Random scale (smaller tiles)
+    scales = [0.1 + 0.4 * rand() for _ in range(total_tiles)]  # 10% to 50% original size
+    
+    assets = [None] * total_tiles
+    tile_elements = [None] * total_tiles
+    
+    # Keys shared by every tile; copying this is cheaper than building each dict
+    # from a literal. Per-tile keys are filled in below (same key order as before).
+    tile_template = {
+        "type": "video",
+        "ref": None,
+        "lane": None,
+        "duration": tile_duration,
+        "offset": "0s",  # When PNG appears relative to its parent
+        "start": tile_start,
+        "name": None,
+    }
+    
+    # Images are drawn from a small set, so resolve each file and derive its
+    # names only once. UIDs are still generated per asset: every asset needs its own.
+    image_info = {}
+    
+    for tile_index, (image_file, x_pos, y_pos, scale) in enumerate(zip(tile_images, x_positions, y_positions, scales)):
+        asset_id = f"r{resource_counter + tile_index}"
+        current_lane = tile_index + 1
+        
+        # Create asset manually to use shared format
+        info = image_info.get(image_file)
+        if info is None:
+            abs_path = Path(image_file).resolve()
+            info = image_info[image_file] = (str(abs_path), abs_path.name, abs_path.stem, image_file.stem)
+        src, file_name, asset_name, tile_name = info
+        
+        assets[tile_index] = Asset(
+            id=asset_id,
+            name=asset_name,
+            uid=generate_uid(f"MEDIA_{file_name}"),
+            duration=IMAGE_DURATION,
+            has_video="1",
+            format=image_format_id,  # Use shared format
+            video_sources="1",
+            media_rep=MediaRep(src=src)
+        )
+        
+        # Uniform scale: format once, use for both axes
+        scale_str = f"{scale:.3f}"
+        
+        tile_element = tile_template.copy()
+        tile_element["ref"] = asset_id
+        tile_element["lane"] = current_lane  # Each PNG gets its own lane (like Go implementation)
+        tile_element["name"] = f"{tile_name}_lane_{current_lane}"
+        tile_element["adjust_transform"] = {
+            "position": f"{x_pos:.3f} {y_pos:.3f}",
+            "scale": f"{scale_str} {scale_str}"
+        }
+        tile_elements[tile_index] = tile_element
+    
+    return assets, tile_elements
+
+
 def create_stress_test_timeline(fcpxml, image_files, video_files):
     """
     Create an extremely complex timeline to stress test all library features.
@@ -282,10 +268,25 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
     )
     fcpxml.resources.formats.append(shared_image_format)
     
+    # Media files are reused many times across segments, so resolve each file and
+    # derive its names only once. UIDs stay per asset (they include segment/element indices).
+    media_info = {}
+    
+    def file_info(media_file):
+        info = media_info.get(media_file)
+        if info is None:
+            abs_path = Path(media_file).resolve()
+            info = media_info[media_file] = (str(abs_path), abs_path.name, abs_path.stem, media_file.stem)
+        return info
+    
+    nested_total = 0  # Counted as segments are filled, for the summary below
+    
     # Phase 1: Create multiple overlapping background video segments
     print("   Phase 1: Creating 5 overlapping background video segments...")
     
     if video_files:
+        bg_duration = convert_seconds_to_fcp_duration(segment_duration)  # Same for every segment
+        
         for segment_idx in range(5):
             video_file = video_files[segment_idx % len(video_files)]  # Cycle through videos
             segment_offset = segment_idx * (segment_duration * 0.8)  # 20% overlap between segments
@@ -305,7 +306,6 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
             needs_scaling = needs_vertical_scaling(str(video_file), is_image=False)
             
             # Create background element
-            bg_duration = convert_seconds_to_fcp_duration(segment_duration)
             bg_offset = convert_seconds_to_fcp_duration(segment_offset)
             
             bg_element = {
@@ -321,8 +321,8 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
                 # Add complex layered transforms for stress testing
                 bg_element["adjust_transform"] = {
                     "scale": VERTICAL_SCALE_FACTOR,
-                    "rotation": str(random.uniform(-5.0, 5.0)),  # Slight rotation
-                    "position": f"{random.uniform(-5.0, 5.0)} {random.uniform(-5.0, 5.0)}"  # Slight position offset
+                    "rotation": f"{random.uniform(-5.0, 5.0):.3f}",  # Slight rotation
+                    "position": f"{random.uniform(-5.0, 5.0):.3f} {random.uniform(-5.0, 5.0):.3f}"  # Slight position offset
                 }
             
             # Add to spine
@@ -331,10 +331,15 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
             
             # Phase 2: Add nested content to this background (Pattern A)
             nested_count = random.randint(8, 15)  # 8-15 nested elements per background
-            bg_element["nested_elements"] = []
+            bg_element["nested_elements"] = nested_elements = [None] * nested_count
+            nested_total += nested_count
             
             print(f"       Adding {nested_count} nested elements to segment {segment_idx + 1}")
             
+            # Each segment owns lanes base+1..base+15; nested_count is at most 15,
+            # so lanes never collide between segments.
+            lane_base = segment_idx * 15
+            
             for nested_idx in range(nested_count):
                 # Alternate between images and videos for nested content
                 if nested_idx % 2 == 0 and image_files:
@@ -353,16 +358,16 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
                 # Create nested asset
                 nested_asset_id = f"r{resource_counter}"
                 resource_counter += 1
+                src, file_name, asset_stem, media_stem = file_info(media_file)
                 
                 if is_image:
                     # Use shared format for images
-                    abs_path = Path(media_file).resolve()
-                    uid = generate_uid(f"NESTED_IMG_{abs_path.name}_{segment_idx}_{nested_idx}")
-                    media_rep = MediaRep(src=str(abs_path))
+                    uid = generate_uid(f"NESTED_IMG_{file_name}_{segment_idx}_{nested_idx}")
+                    media_rep = MediaRep(src=src)
                     
                     asset = Asset(
                         id=nested_asset_id,
-                        name=f"{abs_path.stem}_nested_s{segment_idx}_n{nested_idx}",
+                        name=f"{asset_stem}_nested_s{segment_idx}_n{nested_idx}",
                         uid=uid,
                         duration=IMAGE_DURATION,
                         has_video="1",
@@ -373,7 +378,7 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
                     fcpxml.resources.assets.append(asset)
                     
                     element_type = "video"
-                    element_start = "3600s"  # Standard image timing
+                    element_start = IMAGE_START_TIME  # Standard image timing
                 else:
                     # Create video asset
                     nested_format_id = f"r{resource_counter}"
@@ -387,7 +392,7 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
                     element_start = None  # Videos don't have start attribute
                 
                 # Create complex nested element with extreme transforms
-                lane_number = (segment_idx * 15) + nested_idx + 1  # Unique lane numbers across segments
+                lane_number = lane_base + nested_idx + 1  # Unique lane numbers across segments
                 
                 nested_element = {
                     "type": element_type,
@@ -395,7 +400,7 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
                     "lane": lane_number,
                     "duration": convert_seconds_to_fcp_duration(segment_duration * random.uniform(0.3, 0.9)),
                     "offset": convert_seconds_to_fcp_duration(random.uniform(0, segment_duration * 0.5)),
-                    "name": f"{media_file.stem}_L{lane_number}_S{segment_idx}"
+                    "name": f"{media_stem}_L{lane_number}_S{segment_idx}"
                 }
                 
                 if element_start:
@@ -403,17 +408,20 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
                 
                 # Add extreme transforms for stress testing
                 nested_element["adjust_transform"] = {
-                    "position": f"{random.uniform(-100.0, 100.0)} {random.uniform(-150.0, 150.0)}",
-                    "scale": f"{random.uniform(0.05, 2.0)} {random.uniform(0.05, 2.0)}",
-                    "rotation": str(random.uniform(-180.0, 180.0))
+                    "position": f"{random.uniform(-100.0, 100.0):.3f} {random.uniform(-150.0, 150.0):.3f}",
+                    "scale": f"{random.uniform(0.05, 2.0):.3f} {random.uniform(0.05, 2.0):.3f}",
+                    "rotation": f"{random.uniform(-180.0, 180.0):.3f}"
                 }
                 
-                bg_element["nested_elements"].append(nested_element)
+                nested_elements[nested_idx] = nested_element
     
     # Phase 3: Add separate spine elements (Pattern B) for additional stress
     print("   Phase 3: Adding separate spine elements for additional complexity...")
     
     separate_elements_count = 25  # 25 additional separate elements
+    separate_elements = [None] * separate_elements_count
+    separate_videos = []
+    separate_clips = []
     for sep_idx in range(separate_elements_count):
         # Choose random media
         if sep_idx % 3 == 0 and image_files:
@@ -424,21 +432,21 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
             is_image = False
         else:
             media_file = random.choice(image_files) if image_files else random.choice(video_files)
-            is_image = media_file.suffix.lower() in {'.png', '.jpg', '.jpeg'}
+            is_image = media_file.suffix.lower() in IMAGE_EXTENSIONS
         
         # Create asset
         sep_asset_id = f"r{resource_counter}"
         resource_counter += 1
+        src, file_name, asset_stem, media_stem = file_info(media_file)
         
         if is_image:
             # Use shared format for images
-            abs_path = Path(media_file).resolve()
-            uid = generate_uid(f"SEP_IMG_{abs_path.name}_{sep_idx}")
-            media_rep = MediaRep(src=str(abs_path))
+            uid = generate_uid(f"SEP_IMG_{file_name}_{sep_idx}")
+            media_rep = MediaRep(src=src)
             
             asset = Asset(
                 id=sep_asset_id,
-                name=f"{abs_path.stem}_separate_{sep_idx}",
+                name=f"{asset_stem}_separate_{sep_idx}",
                 uid=uid,
                 duration=IMAGE_DURATION,
                 has_video="1",
@@ -474,7 +482,7 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
             "lane": lane_number,
             "duration": convert_seconds_to_fcp_duration(element_duration),
             "offset": convert_seconds_to_fcp_duration(element_offset),
-            "name": f"{media_file.stem}_separate_L{lane_number}"
+            "name": f"{media_stem}_separate_L{lane_number}"
         }
         
         if element_start is not None:
@@ -482,31 +490,37 @@ def create_stress_test_timeline(fcpxml, image_files, video_files):
         
         # Add extreme transforms and effects
         separate_element["adjust_transform"] = {
-            "position": f"{random.uniform(-200.0, 200.0)} {random.uniform(-300.0, 300.0)}",
-            "scale": f"{random.uniform(0.01, 5.0)} {random.uniform(0.01, 5.0)}",
-            "rotation": str(random.uniform(-360.0, 360.0))
+            "position": f"{random.uniform(-200.0, 200.0):.3f} {random.uniform(-300.0, 300.0):.3f}",
+            "scale": f"{random.uniform(0.01, 5.0):.3f} {random.uniform(0.01, 5.0):.3f}",
+            "rotation": f"{random.uniform(-360.0, 360.0):.3f}"
         }
         
-        # Add to spine
+        separate_elements[sep_idx] = separate_element
         if element_type == "video":
-            sequence.spine.videos.append(separate_element)
+            separate_videos.append(separate_element)
         else:
-            sequence.spine.asset_clips.append(separate_element)
-        sequence.spine.ordered_elements.append(separate_element)
+            separate_clips.append(separate_element)
+    
+    # Add all separate elements to the spine at once
+    sequence.spine.videos.extend(separate_videos)
+    sequence.spine.asset_clips.extend(separate_clips)
+    sequence.spine.ordered_elements.extend(separate_elements)
     
     # Update sequence duration to total
     sequence.duration = convert_seconds_to_fcp_duration(total_duration)
     
     total_elements = len(sequence.spine.ordered_elements)
-    nested_elements = sum(len(elem.get("nested_elements", [])) for elem in sequence.spine.ordered_elements)
-    
-    print(f"   STRESS TEST COMPLETE:")
-    print(f"     Total spine elements: {total_elements}")
-    print(f"     Total nested elements: {nested_elements}")
-    print(f"     Total resources created: {resource_counter}")
-    print(f"     Maximum lane number: {100 + separate_elements_count}")
-    print(f"     Timeline duration: {total_duration}s ({total_duration/60:.1f} minutes)")
-    print(f"     Complexity level: EXTREME - Testing validation system limits")
+    
+    # One write for the whole summary block
+    print("\n".join([
+        f"   STRESS TEST COMPLETE:",
+        f"     Total spine elements: {total_elements}",
+        f"     Total nested elements: {nested_total}",
+        f"     Total resources created: {resource_counter}",
+        f"     Maximum lane number: {100 + separate_elements_count}",
+        f"     Timeline duration: {total_duration}s ({total_duration/60:.1f} minutes)",
+        f"     Complexity level: EXTREME - Testing validation system limits",
+    ]))
 
 
 def create_staircase_removal_timeline(fcpxml, background_path, tiles_dir, chunk_duration, total_duration, num_squares):
@@ -520,9 +534,6 @@ def create_staircase_removal_timeline(fcpxml, background_path, tiles_dir, chunk_
     4. Uniform chunk duration (fixes the uneven timing in original)
     5. Continues until all squares are removed
     """
-    from pathlib import Path
-    import os
-    
     project = fcpxml.library.events[0].projects[0]
     sequence = project.sequences[0]
     
@@ -595,10 +606,11 @@ def create_staircase_removal_timeline(fcpxml, background_path, tiles_dir, chunk_
     # Create timeline chunks
     current_offset = 0.0
     remaining_tiles = list(tile_files)
+    chunk_duration_fcp = convert_seconds_to_fcp_duration(chunk_duration)  # Same for every chunk
+    chunk_videos = []
     
     for chunk_idx in range(num_chunks):
         chunk_start_time = convert_seconds_to_fcp_duration(current_offset)
-        chunk_duration_fcp = convert_seconds_to_fcp_duration(chunk_duration)
         
         # Determine which tiles are visible in this chunk
         tiles_to_remove = min(squares_per_chunk, len(remaining_tiles))
@@ -607,47 +619,42 @@ def create_staircase_removal_timeline(fcpxml, background_path, tiles_dir, chunk_
         
         visible_tiles = remaining_tiles[tiles_to_remove:]  # Keep the ones not being removed
         
-        # Create main video element with background
-        main_video = {
-            "type": "video",
-            "ref": bg_asset_id,
-            "offset": chunk_start_time,
-            "name": background_asset.name,
-            "start": chunk_start_time,
-            "duration": chunk_duration_fcp,
-            "nested_elements": []
-        }
-        
-        # Add background on lane -1
+        # Background on lane -1
         bg_nested = {
             "type": "video", 
             "ref": bg_asset_id,
             "lane": -1,
             "offset": chunk_start_time,
             "name": background_asset.name,
-            "start": "3600s",  # Using timing pattern from Info.fcpxml
+            "start": IMAGE_START_TIME,  # Using timing pattern from Info.fcpxml
             "duration": chunk_duration_fcp
         }
-        main_video["nested_elements"].append(bg_nested)
+        nested_elements = [bg_nested]
         
         # Add visible tiles on positive lanes
-        for lane_idx, tile_file in enumerate(visible_tiles):
-            tile_asset_id = tile_assets[tile_file.stem]
-            
-            tile_nested = {
+        nested_elements.extend(
+            {
                 "type": "video",
-                "ref": tile_asset_id,
-                "lane": lane_idx + 1,
+                "ref": tile_assets[tile_file.stem],
+                "lane": lane,
                 "offset": chunk_start_time,
                 "name": tile_file.stem,
-                "start": chunk_start_time,  
+                "start": chunk_start_time,
                 "duration": chunk_duration_fcp
             }
-            main_video["nested_elements"].append(tile_nested)
+            for lane, tile_file in enumerate(visible_tiles, start=1)
+        )
         
-        # Add this chunk to the timeline
-        sequence.spine.videos.append(main_video)
-        sequence.spine.ordered_elements.append(main_video)
+        # Create main video element with background
+        chunk_videos.append({
+            "type": "video",
+            "ref": bg_asset_id,
+            "offset": chunk_start_time,
+            "name": background_asset.name,
+            "start": chunk_start_time,
+            "duration": chunk_duration_fcp,
+            "nested_elements": nested_elements
+        })
         
         # Remove tiles for next chunk
         remaining_tiles = remaining_tiles[tiles_to_remove:]
@@ -657,6 +664,10 @@ def create_staircase_removal_timeline(fcpxml, background_path, tiles_dir, chunk_
         if not remaining_tiles:
             break
     
+    # Add all chunks to the timeline at once
+    sequence.spine.videos.extend(chunk_videos)
+    sequence.spine.ordered_elements.extend(chunk_videos)
+    
     # Update sequence duration
     sequence.duration = convert_seconds_to_fcp_duration(total_duration)
     
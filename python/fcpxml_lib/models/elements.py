@@ -7,12 +7,15 @@ import time
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 
+from ..constants import VALID_AUDIO_RATES
 from ..exceptions import ValidationError
-from ..validation.validators import validate_resource_id, validate_frame_alignment, validate_audio_rate
+from ..validation.validators import (
+    validate_resource_id, validate_frame_alignment, validate_audio_rate, validate_fcpxml_version
+)
 from ..utils.ids import generate_uid
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaRep:
     """Media representation with file path and metadata"""
     kind: str = "original-media"
@@ -20,13 +23,18 @@ class MediaRep:
     src: str = ""
     
     def __post_init__(self):
-        if not self.src.startswith("file://"):
-            # Ensure absolute file:// URL format
-            abs_path = os.path.abspath(self.src) if self.src else ""
+        src = self.src
+        if not src.startswith("file://"):
+            # Ensure absolute file:// URL format. Callers mostly pass resolved paths;
+            # those are already what abspath would return, so skip the normalization.
+            if src[:1] == "/" and "//" not in src and "/." not in src and src[-1] != "/":
+                abs_path = src
+            else:
+                abs_path = os.path.abspath(src) if src else ""
             self.src = f"file://{abs_path}"
 
 
-@dataclass 
+@dataclass(slots=True)
 class Format:
     """Video/audio format definition"""
     id: str
@@ -44,7 +52,7 @@ class Format:
             raise ValidationError(f"Frame duration not aligned: {self.frame_duration}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset:
     """Media asset (video, image, audio)"""
     id: str
@@ -72,7 +80,7 @@ class Asset:
             raise ValidationError(f"Asset start time not frame-aligned: {self.start}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Resources:
     """Container for all shared resources"""
     assets: List[Asset] = field(default_factory=list)
@@ -227,7 +235,7 @@ class Clip:
             raise ValidationError(f"Clip duration not frame-aligned: {self.duration}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Spine:
     """Main timeline container - currently empty for minimal implementation"""
     asset_clips: List[Dict] = field(default_factory=list)
@@ -237,7 +245,7 @@ class Spine:
     ordered_elements: List[Dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Sequence:
     """Timeline sequence definition"""
     format: str
@@ -254,11 +262,10 @@ class Sequence:
         if not validate_frame_alignment(self.tc_start):
             raise ValidationError(f"Sequence tc_start not frame-aligned: {self.tc_start}")
         if not validate_audio_rate(self.audio_rate):
-            from ..constants import VALID_AUDIO_RATES
             raise ValidationError(f"Invalid audio rate: {self.audio_rate}. Must be one of {VALID_AUDIO_RATES}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """FCPXML Project definition"""
     name: str
@@ -273,7 +280,7 @@ class Project:
             self.mod_date = time.strftime("%Y-%m-%d %H:%M:%S %z")
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """FCPXML Event definition"""
     name: str
@@ -293,7 +300,7 @@ class SmartCollection:
     rules: List[dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Library:
     """FCPXML Library definition"""
     location: str = ""
@@ -301,7 +308,7 @@ class Library:
     smart_collections: List[SmartCollection] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FCPXML:
     """
     Root FCPXML document.
@@ -317,7 +324,5 @@ class FCPXML:
     
     def __post_init__(self):
         # Validate version follows FCP pattern (major.minor format)
-        import re
-        version_pattern = r"^\d+\.\d+$"  # e.g., "1.13", "1.11", etc.
-        if not re.match(version_pattern, self.version):
+        if not validate_fcpxml_version(self.version):
             raise ValidationError(f"Invalid FCPXML version: {self.version}. Must be in format 'major.minor'")
\ No newline at end of file
@@ -2,6 +2,6 @@
 XML serialization utilities.
 """
 
-from .xml_serializer import serialize_to_xml
+from .xml_serializer import serialize_to_xml, build_xml_tree, write_xml_tree
 
-__all__ = ["serialize_to_xml"]
\ No newline at end of file
+__all__ = ["serialize_to_xml", "build_xml_tree", "write_xml_tree"]
\ No newline at end of file
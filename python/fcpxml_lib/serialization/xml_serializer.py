@@ -2,11 +2,12 @@
 XML serialization for FCPXML documents.
 """
 
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom.minidom import parseString
+from xml.etree.ElementTree import Element, ElementTree, SubElement, indent, tostring
 
 from typing import TYPE_CHECKING
 
+from ..utils.ids import generate_text_style_id
+
 if TYPE_CHECKING:
     from ..models.elements import FCPXML
 
@@ -45,77 +46,81 @@ def serialize_adjust_transform(parent_elem, transform_data):
                 serialize_keyframe_animation(transform_elem, param["name"], param["keyframes"])
 
 
-def serialize_to_xml(fcpxml) -> str:
+def build_xml_tree(fcpxml) -> Element:
     """
-    Serialize FCPXML to XML string using structured approach.
+    Build the indented FCPXML element tree using structured approach.
     
     🚨 CRITICAL: Uses structured XML building with no string templates.
-    
-    Returns only the XML content without declaration (added separately).
     """
     
     # Create root element
-    root = Element("fcpxml")
-    root.set("version", fcpxml.version)
+    root = Element("fcpxml", {"version": fcpxml.version})
     
     # Add resources
     if fcpxml.resources:
         resources_elem = SubElement(root, "resources")
         
+        # Resource attributes are collected into one dict per element (in output
+        # order) and handed to SubElement, instead of one .set() call each.
+        
         # Add formats
         for fmt in fcpxml.resources.formats:
-            format_elem = SubElement(resources_elem, "format")
-            format_elem.set("id", fmt.id)
+            attrib = {"id": fmt.id}
             if fmt.name:
-                format_elem.set("name", fmt.name)
+                attrib["name"] = fmt.name
             if fmt.frame_duration:
-                format_elem.set("frameDuration", fmt.frame_duration)
+                attrib["frameDuration"] = fmt.frame_duration
             if fmt.width:
-                format_elem.set("width", fmt.width)
+                attrib["width"] = fmt.width
             if fmt.height:
-                format_elem.set("height", fmt.height)
+                attrib["height"] = fmt.height
             if fmt.color_space:
-                format_elem.set("colorSpace", fmt.color_space)
+                attrib["colorSpace"] = fmt.color_space
+            SubElement(resources_elem, "format", attrib)
         
         # Add assets (if any)
         for asset in fcpxml.resources.assets:
-            asset_elem = SubElement(resources_elem, "asset")
-            asset_elem.set("id", asset.id)
-            asset_elem.set("name", asset.name)
-            asset_elem.set("uid", asset.uid)
-            asset_elem.set("start", asset.start)
-            asset_elem.set("duration", asset.duration)
-            
+            attrib = {
+                "id": asset.id,
+                "name": asset.name,
+                "uid": asset.uid,
+                "start": asset.start,
+                "duration": asset.duration,
+            }
             if asset.has_video:
-                asset_elem.set("hasVideo", asset.has_video)
+                attrib["hasVideo"] = asset.has_video
             if asset.format:
-                asset_elem.set("format", asset.format)
+                attrib["format"] = asset.format
             if asset.video_sources:
-                asset_elem.set("videoSources", asset.video_sources)
+                attrib["videoSources"] = asset.video_sources
             if asset.has_audio:
-                asset_elem.set("hasAudio", asset.has_audio)
+                attrib["hasAudio"] = asset.has_audio
             if asset.audio_sources:
-                asset_elem.set("audioSources", asset.audio_sources)
+                attrib["audioSources"] = asset.audio_sources
             if asset.audio_channels:
-                asset_elem.set("audioChannels", asset.audio_channels)
+                attrib["audioChannels"] = asset.audio_channels
             if asset.audio_rate:
-                asset_elem.set("audioRate", asset.audio_rate)
+                attrib["audioRate"] = asset.audio_rate
+            asset_elem = SubElement(resources_elem, "asset", attrib)
                 
-            if asset.media_rep:
-                media_rep_elem = SubElement(asset_elem, "media-rep")
-                media_rep_elem.set("kind", asset.media_rep.kind)
-                if asset.media_rep.sig:
-                    media_rep_elem.set("sig", asset.media_rep.sig)
-                media_rep_elem.set("src", asset.media_rep.src)
+            media_rep = asset.media_rep
+            if media_rep:
+                if media_rep.sig:
+                    attrib = {"kind": media_rep.kind, "sig": media_rep.sig, "src": media_rep.src}
+                else:
+                    attrib = {"kind": media_rep.kind, "src": media_rep.src}
+                SubElement(asset_elem, "media-rep", attrib)
         
         # Add title effects (if any)
         for title_effect in fcpxml.resources.title_effects:
-            effect_elem = SubElement(resources_elem, "effect")
-            effect_elem.set("id", title_effect["id"])
-            effect_elem.set("name", title_effect["name"])
-            effect_elem.set("uid", title_effect["uid"])
+            attrib = {
+                "id": title_effect["id"],
+                "name": title_effect["name"],
+                "uid": title_effect["uid"],
+            }
             if "src" in title_effect:
-                effect_elem.set("src", title_effect["src"])
+                attrib["src"] = title_effect["src"]
+            SubElement(resources_elem, "effect", attrib)
 
     # Add library
     if fcpxml.library:
@@ -125,29 +130,30 @@ def serialize_to_xml(fcpxml) -> str:
             
         # Add events
         for event in fcpxml.library.events:
-            event_elem = SubElement(library_elem, "event")
-            event_elem.set("name", event.name)
+            attrib = {"name": event.name}
             if event.uid:
-                event_elem.set("uid", event.uid)
+                attrib["uid"] = event.uid
+            event_elem = SubElement(library_elem, "event", attrib)
                 
             # Add projects
             for project in event.projects:
-                project_elem = SubElement(event_elem, "project")
-                project_elem.set("name", project.name)
+                attrib = {"name": project.name}
                 if project.uid:
-                    project_elem.set("uid", project.uid)
+                    attrib["uid"] = project.uid
                 if project.mod_date:
-                    project_elem.set("modDate", project.mod_date)
+                    attrib["modDate"] = project.mod_date
+                project_elem = SubElement(event_elem, "project", attrib)
                     
                 # Add sequences
                 for sequence in project.sequences:
-                    seq_elem = SubElement(project_elem, "sequence")
-                    seq_elem.set("format", sequence.format)
-                    seq_elem.set("duration", sequence.duration)
-                    seq_elem.set("tcStart", sequence.tc_start)
-                    seq_elem.set("tcFormat", sequence.tc_format)
-                    seq_elem.set("audioLayout", sequence.audio_layout)
-                    seq_elem.set("audioRate", sequence.audio_rate)
+                    seq_elem = SubElement(project_elem, "sequence", {
+                        "format": sequence.format,
+                        "duration": sequence.duration,
+                        "tcStart": sequence.tc_start,
+                        "tcFormat": sequence.tc_format,
+                        "audioLayout": sequence.audio_layout,
+                        "audioRate": sequence.audio_rate,
+                    })
                     
                     # Add spine with media content
                     spine_elem = SubElement(seq_elem, "spine")
@@ -249,7 +255,6 @@ def serialize_to_xml(fcpxml) -> str:
                                             # Add text content if available
                                             if "text_content" in nested:
                                                 # Generate unique text style ID
-                                                from fcpxml_lib.utils.ids import generate_text_style_id
                                                 text_style_id = generate_text_style_id()
                                                 
                                                 text_elem = SubElement(nested_title_elem, "text")
@@ -534,14 +539,50 @@ def serialize_to_xml(fcpxml) -> str:
                     match_elem = SubElement(collection_elem, "match-ratings")
                     match_elem.set("value", rule["value"])
 
-    # Convert to string without XML declaration
-    rough_string = tostring(root, encoding='unicode')
-    reparsed = parseString(rough_string)
-    pretty_xml = reparsed.toprettyxml(indent="  ", encoding=None)
+    # Pretty-print in place with the C ElementTree instead of re-parsing the
+    # whole document through minidom.
+    indent(root, space="  ")
+    return root
+
+
+# ElementTree writes empty elements as "<tag />"; output keeps the minidom-style
+# "<tag/>". ElementTree escapes ">" in text and attributes, so " />" can only be
+# the end of an empty tag.
+def serialize_to_xml(fcpxml) -> str:
+    """
+    Serialize FCPXML to XML string.
     
-    # Remove the first XML declaration line that parseString adds
-    lines = pretty_xml.split('\n')
-    if lines[0].startswith('<?xml'):
-        lines = lines[1:]
+    Returns only the XML content without declaration (added separately).
+    """
+    return tostring(build_xml_tree(fcpxml), encoding='unicode').replace(" />", "/>")
+
+
+class _EmptyTagWriter:
+    """Text writer that turns " />" into "/>" as ElementTree streams its output."""
+    
+    def __init__(self, file):
+        self._file = file
+        self._pending = ""
+    
+    def write(self, data):
+        data = self._pending + data
+        # Hold back a trailing " " or " /" that the next chunk may complete into " />"
+        keep = 2 if data.endswith(" /") else 1 if data.endswith(" ") else 0
+        self._pending = data[len(data) - keep:] if keep else ""
+        return self._file.write(data[:len(data) - keep].replace(" />", "/>"))
     
-    return '\n'.join(lines).strip()
\ No newline at end of file
+    def flush(self):
+        self._file.write(self._pending)
+        self._pending = ""
+
+
+def write_xml_tree(root: Element, file) -> None:
+    """
+    Stream an element tree from build_xml_tree to an open text file.
+    
+    Writes the same content as serialize_to_xml without building the whole
+    document as one string. No XML declaration is written.
+    """
+    writer = _EmptyTagWriter(file)
+    ElementTree(root).write(writer, encoding='unicode')
+    writer.flush()
\ No newline at end of file
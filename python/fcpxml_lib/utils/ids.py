@@ -9,9 +9,10 @@ import threading
 
 def generate_uid(prefix: str = "") -> str:
     """Generate a unique identifier following FCPXML conventions"""
-    timestamp = str(int(time.time() * 1000000))  # microsecond precision
+    timestamp = str(time.time_ns())  # integer nanoseconds, no float rounding
     source = f"{prefix}-{timestamp}"
-    return hashlib.md5(source.encode()).hexdigest().upper()
+    # 16-byte BLAKE2b: same 32-hex-digit shape as the MD5 UIDs FCP writes, cheaper to compute
+    return hashlib.blake2b(source.encode(), digest_size=16).hexdigest().upper()
 
 
 # Thread-safe resource ID counter
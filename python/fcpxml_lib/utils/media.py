@@ -5,6 +5,7 @@ Shared utilities for media file discovery, processing, and asset creation.
 Extracted from main.py to eliminate code duplication and improve maintainability.
 """
 
+import os
 from pathlib import Path
 from typing import List, Set, Tuple
 
@@ -12,10 +13,41 @@ from fcpxml_lib.models.elements import Format, Asset, MediaRep
 from fcpxml_lib.utils.ids import generate_uid
 from fcpxml_lib.constants import (
     IMAGE_FORMAT_NAME, DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT, IMAGE_COLOR_SPACE,
-    IMAGE_DURATION
+    IMAGE_DURATION, STILL_IMAGE_EXTENSIONS, IMAGE_EXTENSIONS, DISCOVERY_VIDEO_EXTENSIONS
 )
 
 
+def _scan_media_files(input_dir: Path, extension_groups: Tuple[Set[str], ...]) -> List[List[Path]]:
+    """
+    List a directory once and sort its files into one list per extension group.
+    
+    Extensions match in lowercase or all-uppercase form (.png / .PNG), as the
+    previous per-extension glob patterns did.
+    """
+    groups = [
+        {case_ext for ext in extensions for case_ext in (ext, ext.upper())}
+        for extensions in extension_groups
+    ]
+    found = [[] for _ in groups]
+    
+    try:
+        with os.scandir(input_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                dot = name.rfind('.')
+                if dot < 0:
+                    continue
+                ext = name[dot:]
+                for wanted, files in zip(groups, found):
+                    if ext in wanted and entry.is_file():
+                        files.append(Path(entry.path))
+                        break
+    except OSError:  # missing, not a directory, or unreadable
+        return [[] for _ in groups]
+    
+    return found
+
+
 def discover_media_files(input_dir: Path, extensions: Set[str]) -> List[Path]:
     """
     Discover media files in a directory with specified extensions.
@@ -27,16 +59,7 @@ def discover_media_files(input_dir: Path, extensions: Set[str]) -> List[Path]:
     Returns:
         List of Path objects for found media files
     """
-    if not input_dir.exists() or not input_dir.is_dir():
-        return []
-    
-    media_files = []
-    for ext in extensions:
-        # Search for both lowercase and uppercase versions
-        media_files.extend(input_dir.glob(f"*{ext}"))
-        media_files.extend(input_dir.glob(f"*{ext.upper()}"))
-    
-    return media_files
+    return _scan_media_files(input_dir, (extensions,))[0]
 
 
 def discover_image_files(input_dir: Path) -> List[Path]:
@@ -49,8 +72,7 @@ def discover_image_files(input_dir: Path) -> List[Path]:
     Returns:
         List of Path objects for found image files
     """
-    image_extensions = {'.png', '.jpg', '.jpeg'}
-    return discover_media_files(input_dir, image_extensions)
+    return discover_media_files(input_dir, IMAGE_EXTENSIONS)
 
 
 def discover_video_files(input_dir: Path) -> List[Path]:
@@ -63,22 +85,24 @@ def discover_video_files(input_dir: Path) -> List[Path]:
     Returns:
         List of Path objects for found video files
     """
-    video_extensions = {'.mov', '.mp4', '.avi', '.mkv', '.m4v'}
-    return discover_media_files(input_dir, video_extensions)
+    return discover_media_files(input_dir, DISCOVERY_VIDEO_EXTENSIONS)
 
 
 def discover_all_media_files(input_dir: Path) -> Tuple[List[Path], List[Path]]:
     """
     Discover both image and video files in a directory.
     
+    The directory is listed once for both kinds of media.
+    
     Args:
         input_dir: Directory to search in
         
     Returns:
         Tuple of (image_files, video_files) lists
     """
-    image_files = discover_image_files(input_dir)
-    video_files = discover_video_files(input_dir)
+    image_files, video_files = _scan_media_files(
+        input_dir, (IMAGE_EXTENSIONS, DISCOVERY_VIDEO_EXTENSIONS)
+    )
     return image_files, video_files
 
 
@@ -149,11 +173,8 @@ def get_media_type_info(file_path: Path) -> dict:
     """
     ext = file_path.suffix.lower()
     
-    video_extensions = {'.mov', '.mp4', '.avi', '.mkv', '.m4v'}
-    image_extensions = {'.png', '.jpg', '.jpeg', '.tiff', '.bmp', '.gif'}
-    
-    is_video = ext in video_extensions
-    is_image = ext in image_extensions
+    is_video = ext in DISCOVERY_VIDEO_EXTENSIONS
+    is_image = ext in STILL_IMAGE_EXTENSIONS
     
     if is_video:
         type_name = "video"
@@ -2,7 +2,7 @@
 Validation utilities for FCPXML generation.
 """
 
-from .validators import validate_frame_alignment, validate_resource_id, validate_audio_rate
+from .validators import validate_frame_alignment, validate_resource_id, validate_audio_rate, validate_fcpxml_version
 from .xml_validator import run_xml_validation
 
-__all__ = ["validate_frame_alignment", "validate_resource_id", "validate_audio_rate", "run_xml_validation"]
\ No newline at end of file
+__all__ = ["validate_frame_alignment", "validate_resource_id", "validate_audio_rate", "validate_fcpxml_version", "run_xml_validation"]
\ No newline at end of file
@@ -3,34 +3,35 @@ Validation functions for FCPXML elements.
 """
 
 import re
-from ..constants import STANDARD_TIMEBASE, RESOURCE_ID_PATTERN, VALID_AUDIO_RATES
+from functools import lru_cache
 
+from ..constants import STANDARD_TIMEBASE, RESOURCE_ID_PATTERN, FCPXML_VERSION_PATTERN, VALID_AUDIO_RATES
 
+# Compiled once; these run in every model's __post_init__
+_RESOURCE_ID_RE = re.compile(RESOURCE_ID_PATTERN)
+_FCPXML_VERSION_RE = re.compile(FCPXML_VERSION_PATTERN)
+_FRAME_DURATION_RE = re.compile(rf"(-?\d+)/{STANDARD_TIMEBASE}s")  # numerator/timebase
+
+
+@lru_cache(maxsize=1024)  # Models repeat the same few durations (clip length, frame duration)
 def validate_frame_alignment(duration: str) -> bool:
     """Validate that a duration string is frame-aligned according to FCP rules"""
     if duration == "0s":
         return True
-        
-    if not duration.endswith("s"):
-        return False
-        
-    if "/" not in duration:
-        return False
-        
-    try:
-        time_part = duration.rstrip("s")
-        numerator, denominator = map(int, time_part.split("/"))
-        
-        # Check timebase and frame alignment (1001 is the frame duration component)
-        return (denominator == STANDARD_TIMEBASE and 
-                numerator % 1001 == 0)
-    except (ValueError, IndexError):
-        return False
+    
+    # One match checks the shape and the timebase; 1001 is the frame duration component
+    match = _FRAME_DURATION_RE.fullmatch(duration)
+    return match is not None and int(match.group(1)) % 1001 == 0
 
 
 def validate_resource_id(resource_id: str) -> bool:
     """Validate resource ID follows FCP pattern (r1, r2, etc.)"""
-    return bool(re.match(RESOURCE_ID_PATTERN, resource_id))
+    return _RESOURCE_ID_RE.match(resource_id) is not None
+
+
+def validate_fcpxml_version(version: str) -> bool:
+    """Validate FCPXML version follows FCP pattern (major.minor format)"""
+    return _FCPXML_VERSION_RE.match(version) is not None
 
 
 def validate_audio_rate(audio_rate: str) -> bool:
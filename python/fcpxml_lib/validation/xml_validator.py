@@ -2,8 +2,12 @@
 XML validation utilities.
 """
 
-import subprocess
+import io
 import xml.etree.ElementTree as ET
+from functools import lru_cache
+from xml.parsers import expat
+
+from .validators import validate_frame_alignment
 
 
 def run_xml_validation(xml_file_path: str) -> tuple[bool, str]:
@@ -13,38 +17,256 @@ def run_xml_validation(xml_file_path: str) -> tuple[bool, str]:
     🚨 CRITICAL: XML must be well-formed AND semantically valid for FCPXML crash prevention
     
     Performs:
-    1. XML well-formedness validation using xmllint
+    1. XML well-formedness validation (in-process expat parse, no xmllint subprocess)
     2. Semantic validation (ref integrity, required elements)
+    
+    The file is read once and both steps check the same in-memory bytes.
     """
+    # Read the file once; both passes validate the same bytes from memory
+    try:
+        with open(xml_file_path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        return False, f"Could not read XML file: {e}"
+    
     # Step 1: XML well-formedness validation
+    # Namespace-aware like xmllint, so unbound prefixes are rejected too
+    parser = expat.ParserCreate(namespace_separator=' ')
     try:
-        result = subprocess.run(
-            ['xmllint', '--noout', xml_file_path],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode != 0:
-            error_msg = result.stderr.strip()
-            return False, f"XML well-formedness error: {error_msg}"
-            
-    except subprocess.TimeoutExpired:
-        return False, "XML validation timed out"
-    except subprocess.CalledProcessError as e:
-        return False, f"xmllint error: {e.stderr}"
-    except FileNotFoundError:
-        return False, "xmllint not found - install libxml2-utils"
+        parser.Parse(data, True)
+    except expat.ExpatError as e:
+        return False, f"XML well-formedness error: {e}"
     
     # Step 2: Semantic validation
-    semantic_valid, semantic_error = validate_fcpxml_semantics(xml_file_path)
+    semantic_valid, semantic_error = validate_fcpxml_semantics(io.BytesIO(data))
     if not semantic_valid:
         return False, semantic_error
     
     return True, ""
 
 
-def validate_fcpxml_semantics(xml_file_path: str) -> tuple[bool, str]:
+class _OpenElement:
+    """Bookkeeping for an element whose end tag has not been reached yet."""
+    __slots__ = ('elem', 'tag', 'index', 'position', 'child_count', 'tag_counts',
+                 'video_depth', 'seq', 'section', 'clip')
+
+    def __init__(self, elem, index, position, seq):
+        self.elem = elem
+        self.tag = elem.tag
+        self.index = index            # 0-based position among all siblings
+        self.position = position      # 1-based position among same-tag siblings
+        self.child_count = 0
+        self.tag_counts = {}
+        self.video_depth = 0          # deepest chain of nested videos below this element
+        self.seq = seq                # document (pre-)order of the start tag
+        self.section = None           # 'resources' / 'library' for the authoritative top-level sections
+        self.clip = None              # findings collected for a <clip> element
+
+
+def _nesting_path(stack) -> str:
+    """Path in the style used by video nesting errors, e.g. 'library[1]/event[0]'."""
+    return "/".join(f"{frame.tag}[{frame.index}]" for frame in stack[1:])
+
+
+def _element_path(stack) -> str:
+    """XPath-like path in the style FCP uses in its import errors."""
+    return "/fcpxml[1]" + "".join(f"/{frame.tag}[{frame.position}]" for frame in stack[1:])
+
+
+@lru_cache(maxsize=4096)  # Timing strings repeat heavily across a document (shared tile durations/offsets)
+def is_frame_aligned(time_str: str) -> bool:
+    """
+    Check if a timing attribute value like '49049/24000s' is on an edit frame boundary.
+    
+    Rational values use validate_frame_alignment, the same check the models run.
+    Plain second values such as start="3600s" are accepted as well: FCP writes them
+    itself (see the image start time in the samples) and does not treat them as
+    off-boundary on import, so neither does this validator.
+    """
+    if not time_str or validate_frame_alignment(time_str):
+        return True
+    if '/' in time_str:
+        return False
+    
+    # Plain seconds like "3600s"
+    if time_str.endswith('s'):
+        time_str = time_str[:-1]
+    try:
+        float(time_str)
+        return True
+    except ValueError:
+        return False
+
+
+REQUIRED_SMART_COLLECTIONS = {'Projects', 'All Video', 'Audio Only', 'Stills', 'Favorites'}
+
+
+class _DocumentFindings:
+    """Everything the semantic checks need, collected in one pass over a document."""
+    __slots__ = ('seen_ids', 'duplicate_ids', 'used_refs', 'resources_child_count', 'formats',
+                 'assets', 'found_collections', 'nesting_problems', 'frame_errors', 'clips')
+
+    def __init__(self):
+        self.seen_ids = set()              # IDs of direct <resources> children
+        self.duplicate_ids = set()
+        self.used_refs = set()             # ref/format attributes used anywhere in the document
+        self.resources_child_count = None  # None until the top-level <resources> is seen
+        self.formats = set()
+        self.assets = {}                   # asset id -> media-rep attributes (None if missing)
+        self.found_collections = set()
+        self.nesting_problems = []         # (seq, message)
+        self.frame_errors = []
+        self.clips = []                    # per-clip findings, in document order
+
+
+def _scan_fcpxml(source) -> _DocumentFindings:
+    """
+    Collect semantic findings for a document in a single streaming pass (iterparse).
+    
+    Each element is cleared as soon as its end tag is processed, so peak memory
+    stays flat even for stress-test sized files. Parse errors propagate.
+    """
+    findings = _DocumentFindings()
+    seen_ids = findings.seen_ids
+    duplicate_ids = findings.duplicate_ids
+    used_refs = findings.used_refs
+    formats = findings.formats
+    assets = findings.assets
+    found_collections = findings.found_collections
+    nesting_problems = findings.nesting_problems
+    frame_errors = findings.frame_errors
+    clips = findings.clips
+    resources_child_count = None
+    library_seen = False
+    
+    stack = []
+    open_clips = []
+    current_asset = None
+    current_asset_id = None
+    seq = 0
+    
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            attrib = elem.attrib
+            tag = elem.tag
+            
+            if stack:
+                parent = stack[-1]
+                position = parent.tag_counts.get(tag, 0) + 1
+                parent.tag_counts[tag] = position
+                frame = _OpenElement(elem, parent.child_count, position, seq)
+                parent.child_count += 1
+            else:
+                parent = None
+                frame = _OpenElement(elem, 0, 1, seq)
+            seq += 1
+            
+            # Reference integrity (text-style refs are locally scoped within titles)
+            for ref in (attrib.get('ref') if tag != 'text-style' else None, attrib.get('format')):
+                if ref is not None:
+                    used_refs.add(ref)
+            
+            # Top-level sections: the first <resources> and <library> are authoritative
+            depth = len(stack)
+            if depth == 1:
+                if tag == 'resources' and resources_child_count is None:
+                    resources_child_count = 0
+                    frame.section = 'resources'
+                elif tag == 'library' and not library_seen:
+                    library_seen = True
+                    frame.section = 'library'
+            elif depth == 2 and parent.section == 'resources':
+                resources_child_count += 1
+                if 'id' in attrib:
+                    resource_id = attrib['id']
+                    if resource_id in seen_ids:
+                        duplicate_ids.add(resource_id)
+                    seen_ids.add(resource_id)
+                    if tag == 'format':
+                        formats.add(resource_id)
+                    elif tag == 'asset':
+                        current_asset = frame
+                        current_asset_id = resource_id
+                        assets[current_asset_id] = None
+            elif depth == 2 and parent.section == 'library' and tag == 'smart-collection':
+                found_collections.add(attrib.get('name', ''))
+            elif depth == 3 and tag == 'media-rep' and parent is current_asset:
+                if assets[current_asset_id] is None:
+                    assets[current_asset_id] = dict(attrib)
+            
+            # 🚨 CRITICAL: Frame boundary alignment
+            for attr in ('offset', 'duration', 'start'):
+                if attr in attrib:
+                    value = attrib[attr]
+                    if not is_frame_aligned(value):
+                        element_path = _element_path(stack + [frame])
+                        frame_errors.append(f'The item is not on an edit frame boundary ({attr}="{value}": {element_path}/@{attr})')
+            
+            # 🚨 CRITICAL: Clip-to-media association
+            if tag == 'clip':
+                frame.clip = {
+                    'path': _element_path(stack + [frame]),
+                    'format': attrib.get('format'),
+                    'conform_rate': False,
+                    'videos': [],
+                }
+                clips.append(frame.clip)
+                open_clips.append(frame.clip)
+            elif tag == 'conform-rate' and parent is not None and parent.clip is not None:
+                parent.clip['conform_rate'] = True
+            elif tag == 'video' and open_clips:
+                video_ref = attrib.get('ref')
+                video_path = _element_path(stack + [frame])
+                for clip in open_clips:
+                    clip['videos'].append((video_ref, video_path))
+            
+            stack.append(frame)
+        else:
+            frame = stack.pop()
+            
+            # Video nesting depth below this element
+            if frame.tag == 'video' and frame.video_depth > 2:  # More than 2 levels of nesting is problematic
+                nesting_problems.append(
+                    (frame.seq, f"Video element at {_nesting_path(stack + [frame])} has nesting depth {frame.video_depth} (limit: 2)")
+                )
+            if stack:
+                parent = stack[-1]
+                depth_via_child = frame.video_depth + (1 if frame.tag == 'video' else 0)
+                if depth_via_child > parent.video_depth:
+                    parent.video_depth = depth_via_child
+            
+            if frame.clip is not None:
+                open_clips.pop()
+            if frame is current_asset:
+                current_asset = None
+            
+            # Done with this subtree: drop it so memory does not grow with the document.
+            # Earlier siblings were already removed, so it is always the parent's first child.
+            elem.clear()
+            if stack:
+                del stack[-1].elem[0]
+    
+    findings.resources_child_count = resources_child_count
+    return findings
+
+
+def _scan_element(root_element) -> _DocumentFindings:
+    """Run the single-pass scan over an already parsed <fcpxml> element."""
+    return _scan_fcpxml(io.BytesIO(ET.tostring(root_element)))
+
+
+def _nesting_error(findings) -> str:
+    if not findings.nesting_problems:
+        return ""
+    problems = sorted(findings.nesting_problems)
+    return "Problematic video nesting detected: " + "; ".join(msg for _, msg in problems)
+
+
+def _frame_boundary_error(findings) -> str:
+    return "; ".join(findings.frame_errors)
+
+
+def validate_fcpxml_semantics(xml_file_path) -> tuple[bool, str]:
     """
     Validate FCPXML semantic correctness.
     
@@ -55,91 +277,53 @@ def validate_fcpxml_semantics(xml_file_path: str) -> tuple[bool, str]:
     - Required smart collections are present
     - No duplicate IDs
     - Nested video element structure (causes FCP crashes)
+    - Frame boundary alignment of timing attributes
+    - Clip-to-media associations
+    
+    xml_file_path may be a path or a binary file object.
+    
+    All checks run in a single streaming pass over the document (see _scan_fcpxml).
     """
     try:
-        tree = ET.parse(xml_file_path)
-        root = tree.getroot()
-        
-        # Collect all available IDs from resources
-        available_ids = set()
-        resources = root.find('resources')
-        if resources is not None:
-            for child in resources:
-                if 'id' in child.attrib:
-                    available_ids.add(child.attrib['id'])
-        
-        # Collect all ref attributes used in timeline and format references in assets
-        used_refs = set()
-        
-        def collect_refs(element):
-            # Skip text-style refs - they are locally scoped within title elements
-            if 'ref' in element.attrib and element.tag != 'text-style':
-                used_refs.add(element.attrib['ref'])
-            if 'format' in element.attrib:
-                used_refs.add(element.attrib['format'])
-            # Check nested elements recursively
-            for child in element:
-                collect_refs(child)
-        
-        # Start from root and collect all refs (including from resources section)
-        collect_refs(root)
-        
-        # Find missing references
-        missing_refs = used_refs - available_ids
-        if missing_refs:
-            missing_list = ', '.join(sorted(missing_refs))
-            return False, f"Invalid edit with no respective media. Missing resource IDs: {missing_list}"
-        
-        # Check for duplicate IDs
-        all_ids = []
-        if resources is not None:
-            for child in resources:
-                if 'id' in child.attrib:
-                    all_ids.append(child.attrib['id'])
-        
-        duplicate_ids = set()
-        seen_ids = set()
-        for id_val in all_ids:
-            if id_val in seen_ids:
-                duplicate_ids.add(id_val)
-            seen_ids.add(id_val)
-        
-        if duplicate_ids:
-            duplicate_list = ', '.join(sorted(duplicate_ids))
-            return False, f"Duplicate resource IDs found: {duplicate_list}"
-        
-        # Check for required smart collections
-        library = root.find('library')
-        smart_collections = library.findall('smart-collection') if library is not None else []
-        required_collections = {'Projects', 'All Video', 'Audio Only', 'Stills', 'Favorites'}
-        found_collections = {sc.get('name', '') for sc in smart_collections}
-        missing_collections = required_collections - found_collections
-        
-        if missing_collections:
-            missing_list = ', '.join(sorted(missing_collections))
-            return False, f"Missing required smart collections: {missing_list}"
-        
-        # Check for problematic nested video structures
-        video_nesting_error = validate_video_nesting(root)
-        if video_nesting_error:
-            return False, video_nesting_error
-        
-        # 🚨 CRITICAL: Check frame boundary alignment
-        frame_error = validate_frame_boundaries(root)
-        if frame_error:
-            return False, frame_error
-        
-        # 🚨 CRITICAL: Check for FCP-specific media validation issues
-        media_error = validate_media_clip_association(root)
-        if media_error:
-            return False, media_error
-        
-        return True, ""
-        
+        findings = _scan_fcpxml(xml_file_path)
     except ET.ParseError as e:
         return False, f"XML parsing error: {e}"
     except Exception as e:
         return False, f"Semantic validation error: {e}"
+    
+    # Find missing references
+    missing_refs = findings.used_refs - findings.seen_ids
+    if missing_refs:
+        missing_list = ', '.join(sorted(missing_refs))
+        return False, f"Invalid edit with no respective media. Missing resource IDs: {missing_list}"
+    
+    # Check for duplicate IDs
+    if findings.duplicate_ids:
+        duplicate_list = ', '.join(sorted(findings.duplicate_ids))
+        return False, f"Duplicate resource IDs found: {duplicate_list}"
+    
+    # Check for required smart collections
+    missing_collections = REQUIRED_SMART_COLLECTIONS - findings.found_collections
+    if missing_collections:
+        missing_list = ', '.join(sorted(missing_collections))
+        return False, f"Missing required smart collections: {missing_list}"
+    
+    # Check for problematic nested video structures
+    nesting_error = _nesting_error(findings)
+    if nesting_error:
+        return False, nesting_error
+    
+    # 🚨 CRITICAL: Check frame boundary alignment
+    frame_error = _frame_boundary_error(findings)
+    if frame_error:
+        return False, frame_error
+    
+    # 🚨 CRITICAL: Check for FCP-specific media validation issues
+    media_error = _media_clip_association_error(findings)
+    if media_error:
+        return False, media_error
+    
+    return True, ""
 
 
 def validate_video_nesting(root_element) -> str:
@@ -148,51 +332,13 @@ def validate_video_nesting(root_element) -> str:
     
     🚨 CRITICAL: Deeply nested video elements cause "Invalid edit with no respective media" errors
     
-    According to BAFFLE_TWO.md, nested video structures can cause crashes.
-    This function detects problematic patterns.
+    Kept for callers holding a parsed tree; validate_fcpxml_semantics runs this
+    check as part of its single pass.
     
     Returns:
         str: Error message if problem found, empty string if valid
     """
-    def count_video_nesting(element, depth=0):
-        max_depth = depth
-        
-        for child in element:
-            if child.tag == 'video':
-                child_depth = count_video_nesting(child, depth + 1)
-                max_depth = max(max_depth, child_depth)
-            else:
-                child_depth = count_video_nesting(child, depth)
-                max_depth = max(max_depth, child_depth)
-        
-        return max_depth
-    
-    def find_problematic_nesting(element, path=""):
-        problems = []
-        
-        # Check if this video element has many nested videos
-        if element.tag == 'video':
-            nested_videos = element.findall('.//video')  # Find all nested video elements
-            # ❌ REMOVED: Bogus 20-element limit - FCP can handle hundreds of lanes
-            # Final Cut Pro has no practical limit on number of video lanes/nested elements
-            
-            # Check if nested videos have deeply nested structure
-            depth = count_video_nesting(element)
-            if depth > 2:  # More than 2 levels of nesting is problematic
-                problems.append(f"Video element at {path} has nesting depth {depth} (limit: 2)")
-        
-        # Recursively check children
-        for i, child in enumerate(element):
-            child_path = f"{path}/{child.tag}[{i}]" if path else f"{child.tag}[{i}]"
-            problems.extend(find_problematic_nesting(child, child_path))
-        
-        return problems
-    
-    problems = find_problematic_nesting(root_element)
-    if problems:
-        return "Problematic video nesting detected: " + "; ".join(problems)
-    
-    return ""
+    return _nesting_error(_scan_element(root_element))
 
 
 def validate_frame_boundaries(root_element) -> str:
@@ -201,88 +347,29 @@ def validate_frame_boundaries(root_element) -> str:
     
     🚨 CRITICAL: Frame boundary violations cause "The item is not on an edit frame boundary" errors
     
-    FCP requires all timing values (offset, duration, start) to be aligned to frame boundaries
-    using the standard 23.976fps timebase (1001/24000s per frame).
+    Kept for callers holding a parsed tree; validate_fcpxml_semantics runs this
+    check as part of its single pass.
     
     Returns:
         str: Error message if frame boundary violation found, empty string if valid
     """
-    from ..constants import STANDARD_TIMEBASE
-    
-    def is_frame_aligned(time_str: str) -> bool:
-        """Check if a time string like '49049/24000s' is frame-aligned."""
-        if not time_str or time_str == "0s":
-            return True
-            
-        # Parse rational format: "numerator/denominator s"
-        if time_str.endswith('s'):
-            time_str = time_str[:-1]  # Remove 's'
-            
-        if '/' in time_str:
-            try:
-                numerator, denominator = map(int, time_str.split('/'))
-                # For frame alignment, numerator must be divisible by 1001
-                # and denominator must be STANDARD_TIMEBASE (24000)
-                if denominator != STANDARD_TIMEBASE:
-                    return False
-                # Frame-aligned if numerator is multiple of 1001
-                return numerator % 1001 == 0
-            except ValueError:
-                return False
-        else:
-            # Simple format like "2s" - always frame aligned for integer seconds
-            try:
-                float(time_str)
-                return True
-            except ValueError:
-                return False
-    
-    def find_element_path(element, root, current_path=""):
-        """Build XPath-like path by traversing from root to find element."""
-        def build_path(current_elem, target_elem, path_parts):
-            if current_elem == target_elem:
-                return "/fcpxml[1]" + "".join(path_parts)
-            
-            for i, child in enumerate(current_elem):
-                # Count siblings of same tag for position
-                siblings_of_same_tag = [c for c in current_elem if c.tag == child.tag]
-                position = siblings_of_same_tag.index(child) + 1 if child in siblings_of_same_tag else 1
-                
-                child_path = f"/{child.tag}[{position}]"
-                result = build_path(child, target_elem, path_parts + [child_path])
-                if result:
-                    return result
-            return None
-        
-        return build_path(root, element, [])
-    
-    def check_timing_attributes(element, root, path=""):
-        """Recursively check all timing attributes in the tree."""
-        errors = []
-        
-        # Check timing attributes
-        timing_attrs = ['offset', 'duration', 'start']
-        for attr in timing_attrs:
-            if attr in element.attrib:
-                value = element.attrib[attr]
-                if not is_frame_aligned(value):
-                    element_path = find_element_path(element, root)
-                    errors.append(f'The item is not on an edit frame boundary ({attr}="{value}": {element_path}/@{attr})')
-        
-        # Recursively check children
-        for child in element:
-            errors.extend(check_timing_attributes(child, root, path))
-            
-        return errors
+    return _frame_boundary_error(_scan_element(root_element))
+
+
+def validate_media_clip_association(root_element) -> str:
+    """
+    Validate clip-to-media associations to prevent "Invalid edit with no respective media" errors.
     
-    errors = check_timing_attributes(root_element, root_element)
-    if errors:
-        return "; ".join(errors)
+    Kept for callers holding a parsed tree; validate_fcpxml_semantics runs this
+    check as part of its single pass.
     
-    return ""
+    Returns:
+        str: Error message if problem found, empty string if valid
+    """
+    return _media_clip_association_error(_scan_element(root_element))
 
 
-def validate_media_clip_association(root_element) -> str:
+def _media_clip_association_error(findings) -> str:
     """
     Validate clip-to-media associations to prevent "Invalid edit with no respective media" errors.
     
@@ -295,88 +382,45 @@ def validate_media_clip_association(root_element) -> str:
     Returns:
         str: Error message if problem found, empty string if valid
     """
-    
-    def find_element_path(element, root, current_path=""):
-        """Build XPath-like path for error reporting."""
-        def build_path(current_elem, target_elem, path_parts):
-            if current_elem == target_elem:
-                return "/fcpxml[1]" + "".join(path_parts)
-            
-            for i, child in enumerate(current_elem):
-                siblings_of_same_tag = [c for c in current_elem if c.tag == child.tag]
-                position = siblings_of_same_tag.index(child) + 1 if child in siblings_of_same_tag else 1
-                child_path = f"/{child.tag}[{position}]"
-                result = build_path(child, target_elem, path_parts + [child_path])
-                if result:
-                    return result
-            return None
-        
-        return build_path(root, element, [])
-    
-    # Collect all resources for lookup
-    resources = root_element.find('resources')
-    if not resources:
+    if not findings.resources_child_count:
         return "Invalid edit with no respective media: No resources section found"
     
-    assets = {}
-    formats = {}
-    
-    for child in resources:
-        if child.tag == 'asset' and 'id' in child.attrib:
-            assets[child.attrib['id']] = child
-        elif child.tag == 'format' and 'id' in child.attrib:
-            formats[child.attrib['id']] = child
-    
+    formats = findings.formats
+    assets = findings.assets
     errors = []
     
-    def check_clip_validity(element, path=""):
-        """Check if clip elements are properly structured for FCP."""
+    for clip in findings.clips:
+        clip_path = clip['path']
         
-        if element.tag == 'clip':
-            clip_path = find_element_path(element, root_element)
-            
-            # Check 1: Clip should have format attribute
-            if 'format' not in element.attrib:
-                errors.append(f"Invalid edit with no respective media: Clip missing format attribute ({clip_path})")
-            else:
-                format_id = element.attrib['format']
-                if format_id not in formats:
-                    errors.append(f"Invalid edit with no respective media: Clip references unknown format '{format_id}' ({clip_path})")
-            
-            # Check 2: Clip should have conform-rate element
-            conform_rate = element.find('conform-rate')
-            if conform_rate is None:
-                errors.append(f"Invalid edit with no respective media: Clip missing conform-rate element ({clip_path})")
-            
-            # Check 3: Video elements within clip should reference valid assets
-            for video in element.findall('.//video'):
-                if 'ref' not in video.attrib:
-                    video_path = find_element_path(video, root_element)
-                    errors.append(f"Invalid edit with no respective media: Video element missing ref attribute ({video_path})")
-                else:
-                    asset_id = video.attrib['ref']
-                    if asset_id not in assets:
-                        video_path = find_element_path(video, root_element)
-                        errors.append(f"Invalid edit with no respective media: Video references unknown asset '{asset_id}' ({video_path})")
-                    else:
-                        # Check 4: Asset should have media-rep with valid src
-                        asset = assets[asset_id]
-                        media_rep = asset.find('media-rep')
-                        if media_rep is None:
-                            errors.append(f"Invalid edit with no respective media: Asset '{asset_id}' missing media-rep element")
-                        elif 'src' not in media_rep.attrib:
-                            errors.append(f"Invalid edit with no respective media: Asset '{asset_id}' media-rep missing src attribute")
-                        elif not media_rep.attrib['src'].startswith('file://'):
-                            src = media_rep.attrib['src']
-                            errors.append(f"Invalid edit with no respective media: Asset '{asset_id}' media-rep src should start with 'file://' (got: {src})")
+        # Check 1: Clip should have format attribute
+        format_id = clip['format']
+        if format_id is None:
+            errors.append(f"Invalid edit with no respective media: Clip missing format attribute ({clip_path})")
+        elif format_id not in formats:
+            errors.append(f"Invalid edit with no respective media: Clip references unknown format '{format_id}' ({clip_path})")
         
-        # Recursively check children
-        for child in element:
-            check_clip_validity(child, path)
-    
-    check_clip_validity(root_element)
+        # Check 2: Clip should have conform-rate element
+        if not clip['conform_rate']:
+            errors.append(f"Invalid edit with no respective media: Clip missing conform-rate element ({clip_path})")
+        
+        # Check 3: Video elements within clip should reference valid assets
+        for asset_id, video_path in clip['videos']:
+            if asset_id is None:
+                errors.append(f"Invalid edit with no respective media: Video element missing ref attribute ({video_path})")
+            elif asset_id not in assets:
+                errors.append(f"Invalid edit with no respective media: Video references unknown asset '{asset_id}' ({video_path})")
+            else:
+                # Check 4: Asset should have media-rep with valid src
+                media_rep = assets[asset_id]
+                if media_rep is None:
+                    errors.append(f"Invalid edit with no respective media: Asset '{asset_id}' missing media-rep element")
+                elif 'src' not in media_rep:
+                    errors.append(f"Invalid edit with no respective media: Asset '{asset_id}' media-rep missing src attribute")
+                elif not media_rep['src'].startswith('file://'):
+                    src = media_rep['src']
+                    errors.append(f"Invalid edit with no respective media: Asset '{asset_id}' media-rep src should start with 'file://' (got: {src})")
     
     if errors:
         return "; ".join(errors)
     
-    return ""
\ No newline at end of file
+    return ""
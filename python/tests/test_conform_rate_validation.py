@@ -152,7 +152,7 @@ def test_nested_clips_conform_rate_attributes():
     print("✅ Nested clips include proper conform-rate elements with srcFrameRate")
     print(f"   Found {conform_rate_count} conform-rate elements with srcFrameRate attributes")
 
-def test_info_recreation_conform_rate_structure():
+def test_info_recreation_conform_rate_structure(tmp_path):
     """
     Test that the Info.fcpxml recreation includes proper conform-rate elements.
     
@@ -161,10 +161,10 @@ def test_info_recreation_conform_rate_structure():
     
     # Run the Info recreation test
     from tests.test_info_recreation import test_recreate_info_fcpxml
-    test_recreate_info_fcpxml()
+    test_recreate_info_fcpxml(tmp_path)
     
     # Read the generated file
-    with open("test_info_recreation.fcpxml", 'r') as f:
+    with open(tmp_path / "test_info_recreation.fcpxml", 'r') as f:
         content = f.read()
     
     # Verify conform-rate structure matches expectations
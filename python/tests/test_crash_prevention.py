@@ -13,7 +13,9 @@ from xml.etree.ElementTree import fromstring
 
 from fcpxml_lib.core.fcpxml import create_empty_project, add_media_to_timeline, create_media_asset
 from fcpxml_lib.serialization.xml_serializer import serialize_to_xml
-from fcpxml_lib.models.elements import FCPXML, SmartCollection
+from fcpxml_lib.models.elements import FCPXML, SmartCollection, MediaRep
+from fcpxml_lib.exceptions import ValidationError
+from fcpxml_lib.validation.validators import validate_frame_alignment
 
 
 class TestCrashPrevention:
@@ -147,6 +149,19 @@ class TestCrashPrevention:
         
         assert fcpxml.version == "1.13"
 
+    def test_invalid_fcpxml_version_rejected(self):
+        """Test that versions not in major.minor form are rejected."""
+        for version in ("1", "1.13.0", "v1.13", "1.13\nx"):
+            with pytest.raises(ValidationError):
+                FCPXML(version=version)
+
+    def test_frame_alignment_validation(self):
+        """Test that only whole frames on the 24000 timebase are accepted."""
+        for duration in ("0s", "1001/24000s", "240240/24000s", "-1001/24000s"):
+            assert validate_frame_alignment(duration), duration
+        for duration in ("1000/24000s", "1001/30000s", "1001/24000", "10s", "1001/24000ss", "r/24000s", ""):
+            assert not validate_frame_alignment(duration), duration
+
     def test_timeline_element_separation(self):
         """Test that images use <video> and videos use <asset-clip> elements."""
         # This is tested through integration but we can verify the logic exists
@@ -182,4 +197,12 @@ class TestCrashPrevention:
             assert os.path.isabs(asset.media_rep.src.replace("file://", ""))
             
         finally:
-            os.unlink(tmp_path)
\ No newline at end of file
+            os.unlink(tmp_path)
+
+    def test_media_rep_src_normalized(self):
+        """Test that media-rep src is an absolute, normalized file:// URL for any input path."""
+        for path in ("/tmp/clip.mov", "/tmp/../tmp/clip.mov", "/tmp/./clip.mov", "//tmp/clip.mov", "clip.mov"):
+            assert MediaRep(src=path).src == f"file://{os.path.abspath(path)}", path
+        
+        # Already-formed URLs are kept as-is
+        assert MediaRep(src="file:///tmp/clip.mov").src == "file:///tmp/clip.mov"
@@ -16,7 +16,7 @@ from fcpxml_lib.models.elements import (
 from fcpxml_lib.utils.ids import generate_resource_id
 from fcpxml_lib.serialization.xml_serializer import serialize_to_xml
 
-def test_recreate_info_fcpxml():
+def test_recreate_info_fcpxml(tmp_path):
     """
     Recreate the complete Info.fcpxml structure using Python functions and dataclasses.
     This generates a valid FCPXML that can be imported into Final Cut Pro.
@@ -296,7 +296,7 @@ def test_recreate_info_fcpxml():
     sequence.spine.ordered_elements.append(main_clip_dict)
     
     # Generate XML and save to file
-    output_file = "test_info_recreation.fcpxml"
+    output_file = str(tmp_path / "test_info_recreation.fcpxml")
     success = save_fcpxml(fcpxml, output_file)
     
     # NOTE: Temporarily ignoring validation failure for nested clips format attributes
@@ -272,4 +272,17 @@ class TestIntegration:
             
         finally:
             if os.path.exists(output_path):
-                os.unlink(output_path)
\ No newline at end of file
+                os.unlink(output_path)
+
+    def test_malformed_xml_rejected(self):
+        """Test that well-formedness errors are reported before semantic checks."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.fcpxml', delete=False) as tmp:
+            tmp.write('<?xml version="1.0" encoding="UTF-8"?>\n<fcpxml version="1.13"><resources></fcpxml>')
+            output_path = tmp.name
+        
+        try:
+            is_valid, error_msg = run_xml_validation(output_path)
+            assert not is_valid
+            assert error_msg.startswith("XML well-formedness error: mismatched tag: line 2")
+        finally:
+            os.unlink(output_path)
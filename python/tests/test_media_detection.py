@@ -10,7 +10,10 @@ import tempfile
 import os
 from unittest.mock import patch, MagicMock
 
+from pathlib import Path
+
 from fcpxml_lib.core.fcpxml import detect_video_properties, create_media_asset
+from fcpxml_lib.utils.media import discover_all_media_files, discover_image_files
 
 
 class TestMediaDetection:
@@ -205,4 +208,22 @@ class TestMediaDetection:
             mock_run.side_effect = [mock_video_result, mock_audio_result]
             
             props = detect_video_properties("test.mp4")
-            assert abs(props["frame_rate"] - expected) < 0.001
\ No newline at end of file
+            assert abs(props["frame_rate"] - expected) < 0.001
+
+    def test_discover_all_media_files(self):
+        """Test that one directory scan splits images and videos by extension."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ['a.png', 'b.JPG', 'c.Png', 'd.mov', 'e.MP4', 'notes.txt', 'png']:
+                Path(tmp_dir, name).write_bytes(b'fake')
+            os.mkdir(os.path.join(tmp_dir, 'folder.png'))
+            
+            image_files, video_files = discover_all_media_files(Path(tmp_dir))
+            
+            # Lowercase and uppercase extensions match; mixed case and directories do not
+            assert sorted(f.name for f in image_files) == ['a.png', 'b.JPG']
+            assert sorted(f.name for f in video_files) == ['d.mov', 'e.MP4']
+
+    def test_discover_missing_directory(self):
+        """Test that discovery in a missing directory returns no files."""
+        assert discover_image_files(Path("nonexistent_media_dir")) == []
+        assert discover_all_media_files(Path("nonexistent_media_dir")) == ([], [])
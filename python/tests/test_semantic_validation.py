@@ -0,0 +1,175 @@
+"""
+Tests for FCPXML semantic validation.
+
+Tests that validate_fcpxml_semantics catches the patterns that make Final Cut Pro
+reject an import, and reports them with the same paths FCP uses in its errors.
+"""
+
+import io
+import pytest
+import tempfile
+import os
+from xml.etree.ElementTree import fromstring
+
+from fcpxml_lib.validation.xml_validator import (
+    validate_fcpxml_semantics, is_frame_aligned,
+    validate_video_nesting, validate_frame_boundaries, validate_media_clip_association
+)
+
+
+SMART_COLLECTIONS = "".join(
+    f'<smart-collection name="{name}" match="all"/>'
+    for name in ("Projects", "All Video", "Audio Only", "Stills", "Favorites")
+)
+
+
+def build_fcpxml(resources: str, spine: str) -> str:
+    """Wrap resources and spine content in a minimal FCPXML document."""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<fcpxml version="1.13">'
+        f'<resources><format id="r1" frameDuration="1001/24000s"/>{resources}</resources>'
+        '<library><event name="E"><project name="P">'
+        f'<sequence format="r1" duration="0s"><spine>{spine}</spine></sequence>'
+        f'</project></event>{SMART_COLLECTIONS}</library>'
+        '</fcpxml>'
+    )
+
+
+@pytest.fixture
+def fcpxml_file():
+    """Write FCPXML content to a temporary file and return its path."""
+    paths = []
+
+    def _write(content: str) -> str:
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.fcpxml', delete=False) as tmp:
+            tmp.write(content)
+            paths.append(tmp.name)
+        return tmp.name
+
+    yield _write
+
+    for path in paths:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+IMAGE_ASSET = '<asset id="r2" name="img" uid="U" start="0s" duration="0s" format="r1"><media-rep kind="original-media" src="file:///tmp/img.png"/></asset>'
+
+
+class TestSemanticValidation:
+    """Test semantic validation of FCPXML documents."""
+
+    def test_valid_document(self, fcpxml_file):
+        """Test that a well-formed, fully referenced document passes."""
+        path = fcpxml_file(build_fcpxml(IMAGE_ASSET, '<video ref="r2" offset="0s" duration="24024/24000s" start="3600s"/>'))
+
+        assert validate_fcpxml_semantics(path) == (True, "")
+
+    def test_validates_in_memory_bytes(self):
+        """Test that a binary file object can be validated without touching disk."""
+        data = build_fcpxml(IMAGE_ASSET, '<video ref="r9" offset="0s" duration="24024/24000s"/>').encode('utf-8')
+
+        assert validate_fcpxml_semantics(io.BytesIO(data)) == (
+            False, "Invalid edit with no respective media. Missing resource IDs: r9"
+        )
+
+    def test_missing_reference(self, fcpxml_file):
+        """Test that refs without a matching resource are reported."""
+        path = fcpxml_file(build_fcpxml(IMAGE_ASSET, '<video ref="r9" offset="0s" duration="24024/24000s"/>'))
+
+        is_valid, error = validate_fcpxml_semantics(path)
+
+        assert not is_valid
+        assert error == "Invalid edit with no respective media. Missing resource IDs: r9"
+
+    def test_text_style_refs_are_local(self, fcpxml_file):
+        """Test that text-style refs inside titles are not treated as resource refs."""
+        spine = '<video ref="r2" offset="0s" duration="24024/24000s"><title ref="r2"><text><text-style ref="ts1">Hi</text-style></text></title></video>'
+        path = fcpxml_file(build_fcpxml(IMAGE_ASSET, spine))
+
+        assert validate_fcpxml_semantics(path) == (True, "")
+
+    def test_duplicate_resource_ids(self, fcpxml_file):
+        """Test that duplicate resource IDs are reported."""
+        path = fcpxml_file(build_fcpxml(IMAGE_ASSET + IMAGE_ASSET, ''))
+
+        assert validate_fcpxml_semantics(path) == (False, "Duplicate resource IDs found: r2")
+
+    def test_frame_boundary_path(self, fcpxml_file):
+        """Test that frame boundary errors carry the FCP-style element path."""
+        spine = (
+            '<video ref="r2" offset="0s" duration="24024/24000s"/>'
+            '<video ref="r2" offset="1000/24000s" duration="24024/24000s"/>'
+        )
+        path = fcpxml_file(build_fcpxml(IMAGE_ASSET, spine))
+
+        is_valid, error = validate_fcpxml_semantics(path)
+
+        assert not is_valid
+        assert error == (
+            'The item is not on an edit frame boundary (offset="1000/24000s": '
+            '/fcpxml[1]/library[1]/event[1]/project[1]/sequence[1]/spine[1]/video[2]/@offset)'
+        )
+
+    def test_frame_boundary_values(self):
+        """Test that rational values follow the model check and plain seconds are accepted."""
+        for value in ("0s", "1001/24000s", "3600s", "5s"):
+            assert is_frame_aligned(value), value
+        for value in ("1000/24000s", "1001/30000s", "1001/24000", "+1001/24000s", "abc"):
+            assert not is_frame_aligned(value), value
+
+    def test_deep_video_nesting(self, fcpxml_file):
+        """Test that more than 2 levels of nested video elements are rejected."""
+        spine = '<video ref="r2"><video ref="r2"><video ref="r2"><video ref="r2"/></video></video></video>'
+        path = fcpxml_file(build_fcpxml(IMAGE_ASSET, spine))
+
+        is_valid, error = validate_fcpxml_semantics(path)
+
+        assert not is_valid
+        assert error == (
+            "Problematic video nesting detected: Video element at "
+            "library[1]/event[0]/project[0]/sequence[0]/spine[0]/video[0] has nesting depth 3 (limit: 2)"
+        )
+
+    def test_clip_requires_conform_rate(self, fcpxml_file):
+        """Test that clip elements without conform-rate are rejected."""
+        spine = '<clip offset="0s" duration="24024/24000s" format="r1"><video ref="r2" offset="0s" duration="24024/24000s"/></clip>'
+        path = fcpxml_file(build_fcpxml(IMAGE_ASSET, spine))
+
+        is_valid, error = validate_fcpxml_semantics(path)
+
+        assert not is_valid
+        assert "Clip missing conform-rate element (/fcpxml[1]/library[1]/event[1]/project[1]/sequence[1]/spine[1]/clip[1])" in error
+
+    def test_clip_video_asset_needs_file_url(self, fcpxml_file):
+        """Test that videos inside clips must reference assets with file:// media-reps."""
+        asset = '<asset id="r2" name="img" uid="U" start="0s" duration="0s"><media-rep src="/tmp/img.png"/></asset>'
+        spine = '<clip offset="0s" duration="24024/24000s" format="r1"><conform-rate scaleEnabled="0" srcFrameRate="24"/><video ref="r2" offset="0s" duration="24024/24000s"/></clip>'
+        path = fcpxml_file(build_fcpxml(asset, spine))
+
+        is_valid, error = validate_fcpxml_semantics(path)
+
+        assert not is_valid
+        assert error == "Invalid edit with no respective media: Asset 'r2' media-rep src should start with 'file://' (got: /tmp/img.png)"
+
+    def test_tree_level_checks(self):
+        """Test that the per-check functions work on an already parsed tree."""
+        spine = '<video ref="r2" offset="1000/24000s" duration="24024/24000s"/>'
+        root = fromstring(build_fcpxml(IMAGE_ASSET, spine).split('?>', 1)[1])
+        
+        assert validate_video_nesting(root) == ""
+        assert validate_frame_boundaries(root) == (
+            'The item is not on an edit frame boundary (offset="1000/24000s": '
+            '/fcpxml[1]/library[1]/event[1]/project[1]/sequence[1]/spine[1]/video[1]/@offset)'
+        )
+        assert validate_media_clip_association(root) == ""
+
+    def test_malformed_xml(self, fcpxml_file):
+        """Test that parse errors are reported instead of raised."""
+        path = fcpxml_file('<fcpxml version="1.13"><resources></fcpxml>')
+
+        is_valid, error = validate_fcpxml_semantics(path)
+
+        assert not is_valid
+        assert error.startswith("XML parsing error:")
@@ -5,12 +5,13 @@ Tests that the generated XML follows the correct FCPXML schema and includes
 all required elements to prevent FCP crashes.
 """
 
+import io
 import pytest
 from xml.etree.ElementTree import fromstring
 import xml.etree.ElementTree as ET
 
 from fcpxml_lib.core.fcpxml import create_empty_project
-from fcpxml_lib.serialization.xml_serializer import serialize_to_xml
+from fcpxml_lib.serialization.xml_serializer import serialize_to_xml, build_xml_tree, write_xml_tree
 from fcpxml_lib.models.elements import SmartCollection
 
 
@@ -228,4 +229,25 @@ class TestXMLStructure:
         # Check format (should be r1, r2, r3, etc.)
         for resource_id in resource_ids:
             assert resource_id.startswith('r'), f"Resource ID {resource_id} should start with 'r'"
-            assert resource_id[1:].isdigit(), f"Resource ID {resource_id} should be r followed by digits"
\ No newline at end of file
+            assert resource_id[1:].isdigit(), f"Resource ID {resource_id} should be r followed by digits"
+
+    def test_pretty_printed_layout(self):
+        """Test that output is indented by two spaces and empty tags are written as <tag/>."""
+        fcpxml = create_empty_project()
+        xml_content = serialize_to_xml(fcpxml)
+        
+        lines = xml_content.split('\n')
+        assert lines[0].startswith('<fcpxml ')
+        assert lines[1] == '  <resources>'
+        assert lines[-1] == '</fcpxml>'
+        assert ' />' not in xml_content
+        assert '<spine/>' in xml_content
+
+    def test_streamed_output_matches_string(self):
+        """Test that streaming the tree to a file writes exactly the serialized string."""
+        fcpxml = create_empty_project()
+        
+        stream = io.StringIO()
+        write_xml_tree(build_xml_tree(fcpxml), stream)
+        
+        assert stream.getvalue() == serialize_to_xml(fcpxml)